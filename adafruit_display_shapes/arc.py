@@ -22,15 +22,18 @@ Implementation Notes
 """
 
 try:
-    from typing import Optional
+    from typing import Iterator, Optional, Tuple
 except ImportError:
     pass
 
 import math
+from array import array
 
+import bitmaptools
 import displayio
 
 from adafruit_display_shapes.polygon import Polygon
+from adafruit_display_shapes.shape_cache import ShapeCache
 
 try:
     import vectorio
@@ -59,14 +62,34 @@ class Arc(displayio.Group):
     :param float radius: The (outer) radius of the arc.
     :param float angle: The angle of the arc in degrees.
     :param float direction: The direction of the middle-point of the arc in degrees (0)
-    :param int segments: The number of segments of the arc.
+    :param int segments: The number of segments of the arc. Ignored if ``tolerance`` is set.
     :param arc_width int: (Optional) The width of the arc. This creates an inner arc as well.
     :param int|None outline: The outline of the arc. Can be a hex value for a color or
                     ``None`` for no outline.
     :param int|None fill: The fill-color of the arc. Can be a hex value for a color or
-                    ``None`` for no filling. Ignored if port does not support vectorio.
+                    ``None`` for no filling. Drawn into the outline bitmap if the port does
+                    not support vectorio.
+    :param float|None tolerance: (Optional) Use as few segments as keep every chord within
+                    this many pixels of the circle, recounted whenever the radius or the
+                    angle changes. (None for a fixed number of ``segments``)
+    :param bool exact: (Optional) Draw exactly the pixels whose centers lie in the arc into
+                    a bitmap, scanline by scanline, instead of a polygon. ``segments`` is
+                    ignored and vectorio is not needed. The outline is the one pixel wide
+                    edge of the arc. (False)
     """
 
+    # in the order update() sets them, as the direction depends on the angle
+    _PROPERTIES = (
+        "radius",
+        "angle",
+        "direction",
+        "segments",
+        "tolerance",
+        "arc_width",
+        "outline",
+        "fill",
+    )
+
     def __init__(
         self,
         radius: float,
@@ -77,6 +100,8 @@ class Arc(displayio.Group):
         arc_width: Optional[int] = 1,
         outline: Optional[int] = None,
         fill: Optional[int] = None,
+        tolerance: Optional[float] = None,
+        exact: bool = False,
         **kwargs,
     ) -> None:
         super().__init__(*args, **kwargs)
@@ -86,31 +111,68 @@ class Arc(displayio.Group):
         self._radius = radius
         self._angle = angle
         self._segments = segments
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError("Tolerance must be larger than 0.")
+        self._tolerance = tolerance
         self._outline = outline
         self._fill = fill
         self._arc_width = arc_width
         self.palette = None
         self.vector_polygon = None
         self.outline_polygon = None
+        self._exact = exact
+        self.sector = None
+        self._sector_drawn = (0, 0, 0, 0)
+        self._batching = False
+
+        self._init_arc()
 
+    def update(self, **props) -> None:
+        """Change several properties at once and rebuild the arc only once, e.g.
+        ``arc.update(angle=90, direction=45, fill=0xFF0000)``. The angle is set before
+        the direction, whatever the order of the arguments.
+
+        :param props: New values of ``radius``, ``angle``, ``direction``, ``segments``,
+                    ``tolerance``, ``arc_width``, ``outline`` and ``fill``.
+        """
+        unknown = [name for name in props if name not in self._PROPERTIES]
+        if unknown:
+            raise TypeError("Unknown Arc properties: " + ", ".join(unknown))
+        self._batching = True
+        try:
+            for name in self._PROPERTIES:
+                if name in props:
+                    setattr(self, name, props[name])
+        finally:
+            self._batching = False
         self._init_arc()
 
     def _init_arc(self):
-        # create outer points
+        if self._batching:
+            return
+        if self._exact:
+            self._draw_sector()
+            return
+        if self._tolerance is not None:
+            self._segments = self._tolerance_segments()
+        # Both rings share the unit vectors, rotated from a table for the angular
+        # resolution into the direction of the arc
+        table = _unit_table(self._angle / self._segments, self._segments + 1)
+        alpha = self._direction / 180 * math.pi
+        (cos_d, sin_d) = (math.cos(alpha), math.sin(alpha))
+        inner_radius = self._radius - self._arc_width
         points = []
+        inner = []
         for i in range(self._segments + 1):
-            alpha = (i * self._angle / self._segments + self._direction) / 180 * math.pi
-            x0 = int(self._radius * math.cos(alpha))
-            y0 = -int(self._radius * math.sin(alpha))
-            points.append((x0, y0))
-
-        # create inner points
-        if self._arc_width > 1:
-            for i in range(self._segments, -1, -1):
-                alpha = (i * self._angle / self._segments + self._direction) / 180 * math.pi
-                x0 = int((self._radius - self._arc_width) * math.cos(alpha))
-                y0 = -int((self._radius - self._arc_width) * math.sin(alpha))
-                points.append((x0, y0))
+            cos_a = table[2 * i] * cos_d - table[2 * i + 1] * sin_d
+            sin_a = table[2 * i] * sin_d + table[2 * i + 1] * cos_d
+            # create outer points
+            points.append((_truncate(self._radius * cos_a), -_truncate(self._radius * sin_a)))
+            # create inner points
+            if self._arc_width > 1:
+                inner.append((_truncate(inner_radius * cos_a), -_truncate(inner_radius * sin_a)))
+        inner.reverse()
+        points.extend(inner)
 
         # create polygon(s) and add to ourselves
         if self._arc_width > 1 and HAVE_VECTORIO and self._fill is not None:
@@ -124,18 +186,87 @@ class Arc(displayio.Group):
                 self.append(self.vector_polygon)
             else:
                 self.vector_polygon.points = points
-
-        if self._outline is not None:
-            if self.outline_polygon is None:
-                self.outline_polygon = Polygon(
-                    points, outline=self._outline, colors=1, close=self._arc_width > 1
-                )
-            else:
-                self.remove(self.outline_polygon)
-                self.outline_polygon = Polygon(
-                    points, outline=self._outline, colors=1, close=self._arc_width > 1
-                )
+                self.vector_polygon.hidden = False
+        elif self.vector_polygon is not None:
+            self.vector_polygon.hidden = True
+
+        # without vectorio, the fill is scan converted into the outline bitmap
+        fill = None if HAVE_VECTORIO or self._arc_width <= 1 else self._fill
+        if self._outline is None and fill is None:
+            if self.outline_polygon is not None:
+                self.outline_polygon.hidden = True
+        elif self.outline_polygon is None:
+            # The bitmap covers every direction and angle, so that the arc can
+            # be redrawn into it. Inner points lie past the outer ones when the
+            # arc is wider than its radius.
+            size = 2 * int(max(self._radius, self._arc_width - self._radius)) + 1
+            self.outline_polygon = Polygon(
+                points,
+                outline=self._outline,
+                fill=fill,
+                colors=1 if fill is None else 2,
+                close=self._arc_width > 1,
+                bitmap_size=(size, size),
+            )
             self.append(self.outline_polygon)
+        else:
+            # redraw into the existing bitmap when possible
+            polygon = self.outline_polygon._update(
+                points,
+                outline=self._outline,
+                fill=fill,
+                close=self._arc_width > 1,
+                stroke=1,
+            )
+            polygon.hidden = False
+            if polygon is not self.outline_polygon:
+                self[self.index(self.outline_polygon)] = polygon
+                self.outline_polygon = polygon
+
+    def _tolerance_segments(self) -> int:
+        # A chord across step degrees of the outer circle strays up to
+        # radius * (1 - cos(step / 2)) from it; use the widest step that stays
+        # within the tolerance, up to half a circle
+        ratio = 1 - self._tolerance / self._radius if self._radius > 0 else 0
+        step = 2 * math.acos(ratio) / math.pi * 180 if ratio > 0 else 180
+        return max(1, math.ceil(abs(self._angle) / step))
+
+    def _draw_sector(self):
+        # The bitmap covers the whole circle, so that the arc can be redrawn
+        # into it until the radius grows
+        extent = math.ceil(max(self._radius, 0))
+        if self.sector is None or self.sector.bitmap.width < 2 * extent + 1:
+            if self.palette is None:
+                self.palette = displayio.Palette(3)
+                self.palette.make_transparent(0)
+            sector = displayio.TileGrid(
+                displayio.Bitmap(2 * extent + 1, 2 * extent + 1, 3),
+                pixel_shader=self.palette,
+                x=-extent,
+                y=-extent,
+            )
+            if self.sector is None:
+                self.append(sector)
+            else:
+                self[self.index(self.sector)] = sector
+            self.sector = sector
+            self._sector_drawn = (0, 0, 0, 0)
+
+        self.palette[1] = 0 if self._outline is None else self._outline
+        self.palette[2] = 0 if self._fill is None else self._fill
+        bitmap = self.sector.bitmap
+        center = bitmap.width // 2
+        radii = (self._radius, self._radius - self._arc_width)
+        angles = (self._direction, self._direction + self._angle)
+        bitmaptools.fill_region(bitmap, *self._sector_drawn, 0)
+        drawn = (0, 0, 0, 0)
+        if self._outline is not None:
+            drawn = _fill_sector(bitmap, center, radii, angles, 1)
+            # the inside of the arc, one pixel in from its edge
+            _fill_sector(bitmap, center, radii, angles, 0 if self._fill is None else 2, 1)
+        elif self._fill is not None:
+            drawn = _fill_sector(bitmap, center, radii, angles, 2)
+        self._sector_drawn = drawn
 
     @property
     def direction(self):
@@ -171,12 +302,27 @@ class Arc(displayio.Group):
     @property
     def segments(self):
         """Number of segments of the arc, more segments make smoother
-        rounded parts but use more time and memory"""
+        rounded parts but use more time and memory. Setting it turns off the
+        ``tolerance``."""
         return self._segments
 
     @segments.setter
     def segments(self, value):
         self._segments = value
+        self._tolerance = None
+        self._init_arc()
+
+    @property
+    def tolerance(self):
+        """How far in pixels the chords may stray from the circle, or None for a fixed
+        number of segments"""
+        return self._tolerance
+
+    @tolerance.setter
+    def tolerance(self, value):
+        if value is not None and value <= 0:
+            raise ValueError("Tolerance must be larger than 0.")
+        self._tolerance = value
         self._init_arc()
 
     @property
@@ -208,3 +354,142 @@ class Arc(displayio.Group):
     def arc_width(self, value):
         self._arc_width = value
         self._init_arc()
+
+
+_TABLES = ShapeCache(16)
+
+
+def _unit_table(step: float, count: int) -> array:
+    """Unit vectors ``count`` steps of ``step`` degrees around the circle from zero,
+    shared by all arcs with the same angular resolution. Entries ``2 * i`` and
+    ``2 * i + 1`` hold the cosine and sine of ``i * step``.
+
+    :param float step: The angle between the vectors in degrees.
+    :param int count: The least number of vectors.
+    """
+    table = _TABLES.get(step)
+    if table is not None and len(table) >= 2 * count:
+        return table
+
+    table = array("f", [0.0] * (2 * count))
+    for i in range(count):
+        alpha = i * step / 180 * math.pi
+        table[2 * i] = math.cos(alpha)
+        table[2 * i + 1] = math.sin(alpha)
+
+    _TABLES.put(step, table)
+    return table
+
+
+def _truncate(value: float) -> int:
+    # Truncate toward zero like int(), but let a rotated table entry that falls
+    # just short of a whole number count as that number, so that vertices at
+    # exact angles such as the tip of an axis-aligned arc keep their pixel.
+    return int(value + _BIAS) if value >= 0 else int(value - _BIAS)
+
+
+def _fill_sector(
+    bitmap: displayio.Bitmap,
+    center: int,
+    radii: Tuple[float, float],
+    angles: Tuple[float, float],
+    color: int,
+    inset: float = 0,
+) -> Tuple[int, int, int, int]:
+    """Fill the pixels whose centers lie in an annular sector around the pixel
+    ``(center, center)``, with at most four spans per scanline, and return the
+    ``(x1, y1, x2, y2)`` region drawn into, the end coordinates excluded.
+
+    :param tuple radii: The outer and the inner radius. Pixels on the outer circle
+                    belong to the sector, those on the inner one do not.
+    :param tuple angles: The start and end angle of the sector in degrees,
+                    counterclockwise from the right.
+    :param float inset: (Optional) Only fill the pixels at least this far inside the
+                    edge of the sector. (0)
+    """
+    r_out = radii[0] - inset
+    r_in = radii[1] + inset
+    (start, end) = (min(angles), max(angles))
+    if end - start >= 360:
+        planes = None
+    else:
+        # the side of the start edge the sector begins on, and the side of the
+        # end edge it ends on; both for a sector wider than a half circle
+        planes = (
+            _half_plane(start, 1, inset),
+            _half_plane(end, -1, inset),
+            (end - start) % 360 > 180,
+        )
+
+    (left, top, right, bottom) = (bitmap.width, bitmap.height, 0, 0)
+    reach = int(r_out) if r_out >= 0 else -1
+    for row in range(max(center - reach, 0), min(center + reach + 1, bitmap.height)):
+        for first, last in _sector_spans(center - row, r_out, r_in, planes):
+            x_1 = max(center + first, 0)
+            x_2 = min(center + last + 1, bitmap.width)
+            if x_1 < x_2:
+                bitmaptools.fill_region(bitmap, x_1, row, x_2, row + 1, color)
+                (left, top) = (min(left, x_1), min(top, row))
+                (right, bottom) = (max(right, x_2), row + 1)
+    if left >= right:
+        return (0, 0, 0, 0)
+    return (left, top, right, bottom)
+
+
+def _half_plane(angle: float, side: int, inset: float) -> Tuple[float, float, float]:
+    # The points (x, y) left (side 1) or right (side -1) of the line through the
+    # center in the direction of angle, at least inset away from it, are those
+    # with slope * x >= inset + offset * y.
+    alpha = angle / 180 * math.pi
+    return (-side * math.sin(alpha), -side * math.cos(alpha), inset)
+
+
+def _sector_spans(
+    y: int, r_out: float, r_in: float, planes: Optional[tuple]
+) -> Iterator[Tuple[int, int]]:
+    # the spans of a sector on the scanline y (up from the center), as first and
+    # last x relative to the center
+    if y * y > r_out * r_out:
+        return
+    reach = int(math.sqrt(r_out * r_out - y * y))
+    if r_in >= 0 and y * y <= r_in * r_in:
+        hole = int(math.sqrt(r_in * r_in - y * y))
+        rings = ((-reach, -hole - 1), (hole + 1, reach))
+    else:
+        rings = ((-reach, reach),)
+
+    if planes is None:
+        allowed = ((-reach, reach),)
+    else:
+        first = _plane_span(planes[0], y, reach)
+        second = _plane_span(planes[1], y, reach)
+        if planes[2]:
+            allowed = (first, second)
+        else:
+            allowed = ((max(first[0], second[0]), min(first[1], second[1])),)
+
+    for ring in rings:
+        for span in allowed:
+            if max(ring[0], span[0]) <= min(ring[1], span[1]):
+                yield (max(ring[0], span[0]), min(ring[1], span[1]))
+
+
+def _plane_span(plane: Tuple[float, float, float], y: int, reach: int) -> Tuple[int, int]:
+    # the x range of a half plane on the scanline y, limited to -reach..reach
+    (slope, offset, inset) = plane
+    # pixels whose centers lie on the edge belong to the sector, whichever way
+    # the float error of the edge direction goes
+    bound = inset + offset * y - _BIAS
+    if slope > _EPSILON:
+        return (max(math.ceil(bound / slope), -reach), reach)
+    if slope < -_EPSILON:
+        return (-reach, min(math.floor(bound / slope), reach))
+    if bound <= 0:
+        return (-reach, reach)
+    return (1, 0)
+
+
+# below this, an edge counts as horizontal
+_EPSILON = 1e-9
+# well above the float error of a coordinate or of a distance to an edge, in pixels
+_BIAS = 1e-4
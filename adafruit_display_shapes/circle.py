@@ -26,7 +26,9 @@ try:
 except ImportError:
     pass
 
-from adafruit_display_shapes.roundrect import RoundRect
+import bitmaptools
+
+from adafruit_display_shapes.roundrect import RoundRect, _quadrant_spans
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Shapes.git"
@@ -43,6 +45,8 @@ class Circle(RoundRect):
     :param int|None outline: The outline of the circle. Can be a hex value for a color or
                  ``None`` for no outline.
     :param int stroke: Used for the outline. Will not change the radius.
+    :param int|None max_r: (Optional) The largest radius ``r`` can be set to later. The
+                 bitmap is sized for it and ``x``/``y`` are relative to it. Defaults to ``r``.
 
     """
 
@@ -55,33 +59,101 @@ class Circle(RoundRect):
         fill: Optional[int] = None,
         outline: Optional[int] = None,
         stroke: int = 1,
+        max_r: Optional[int] = None,
     ) -> None:
+        self._max_r = r if max_r is None else max_r
+        if r > self._max_r:
+            raise ValueError("Radius cannot exceed max_r.")
         super().__init__(
-            x0 - r,
-            y0 - r,
-            2 * r + 1,
-            2 * r + 1,
+            x0 - self._max_r,
+            y0 - self._max_r,
+            2 * self._max_r + 1,
+            2 * self._max_r + 1,
             r,
             fill=fill,
             outline=outline,
             stroke=stroke,
+            max_r=self._max_r,
         )
-        self.r = r
+
+    def _extent(self) -> int:
+        # a circle has no flat sides to repeat, so it always gets a full bitmap
+        return self._max_r
+
+    def _draw(self, width: int, height: int) -> None:
+        self._draw_rows(-1, self._r)
+
+    def _draw_rows(self, old_r: int, r: int) -> None:
+        # Turn a circle of radius old_r (-1 for none) into one of radius r, only
+        # writing the rows and spans that differ between the two.
+        center = self._max_r
+        reach = max(old_r, r)
+        bitmap = self._bitmap
+        for y in range(center - reach, center + reach + 1):
+            d_y = abs(y - center)
+            (old_outer, old_inner) = self._extents(old_r, d_y)
+            (outer, inner) = self._extents(r, d_y)
+            if old_outer > outer:
+                bitmaptools.fill_region(bitmap, center - old_outer, y, center - outer, y + 1, 0)
+                bitmaptools.fill_region(
+                    bitmap, center + outer + 1, y, center + old_outer + 1, y + 1, 0
+                )
+            if inner > old_inner:
+                bitmaptools.fill_region(
+                    bitmap, center - inner, y, center - old_inner, y + 1, self._FILL
+                )
+                bitmaptools.fill_region(
+                    bitmap, center + old_inner + 1, y, center + inner + 1, y + 1, self._FILL
+                )
+            if outer > inner:
+                bitmaptools.fill_region(
+                    bitmap, center - outer, y, center - inner, y + 1, self._OUTLINE
+                )
+                bitmaptools.fill_region(
+                    bitmap, center + inner + 1, y, center + outer + 1, y + 1, self._OUTLINE
+                )
+
+    def _extents(self, r: int, d_y: int) -> tuple:
+        # largest horizontal distance from the center of the circle and of its
+        # fill on the row d_y away from the center, -1 for none
+        if d_y > r:
+            return (-1, -1)
+        stroke = self._stroke if self._outlined else 0
+        if not d_y:
+            return (r, max(r - stroke, -1))
+        spans = _quadrant_spans(r, stroke)
+        row = r - d_y
+        if row < stroke:
+            return (r - spans[2 * row], -1)
+        return (r - spans[2 * row], r - spans[2 * row + 1])
+
+    @property
+    def r(self) -> int:
+        """The radius of the circle. Can be changed up to ``max_r``; only the rows and
+        spans that differ are redrawn."""
+        return self._r
+
+    @r.setter
+    def r(self, r: int) -> None:
+        if r < 0 or r > self._max_r:
+            raise ValueError("Radius cannot exceed max_r.")
+        self._draw_rows(self._r, r)
+        self._r = r
 
     @property
     def x0(self) -> int:
         """The x-position of the center of the circle."""
-        return self.x + self.r
+        return self.x + self._max_r
 
     @property
     def y0(self) -> int:
         """The y-position of the center of the circle."""
-        return self.y + self.r
+        return self.y + self._max_r
 
     @x0.setter
     def x0(self, x0: int) -> None:
-        self.x = x0 - self.r
+        self.x = x0 - self._max_r
 
     @y0.setter
     def y0(self, y0: int) -> None:
-        self.y = y0 - self.r
+        self.y = y0 - self._max_r
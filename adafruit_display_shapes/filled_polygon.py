@@ -45,16 +45,20 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Shapes.gi
 class FilledPolygon(displayio.Group):
     """A filled polygon. Technically, an FilledPolygon is a Group with one or two polygons.
 
-    :param list points: A list of (x, y) tuples of the points
+    :param list points: A list of (x, y) tuples of the points, or a flat sequence of
+                    interleaved x and y values such as an ``array("h")``. It is not copied.
     :param int|None outline: The outline of the arc. Can be a hex value for a color or
                     ``None`` for no outline.
     :param int|None fill: The fill-color of the arc. Can be a hex value for a color or
-                    ``None`` for no filling. Ignored if port does not support vectorio.
+                    ``None`` for no filling. Drawn into the outline bitmap if the port does
+                    not support vectorio.
     :param bool close: (Optional) Wether to connect first and last point. (True)
     :param int stroke: Thickness of the outline.
 
     """
 
+    _PROPERTIES = ("points", "outline", "fill", "close", "stroke")
+
     def __init__(
         self,
         points: List[Tuple[int, int]],
@@ -74,10 +78,32 @@ class FilledPolygon(displayio.Group):
         self.palette = None
         self.vector_polygon = None
         self.outline_polygon = None
+        self._batching = False
+
+        self._init_polygon()
 
+    def update(self, **props) -> None:
+        """Change several properties at once and rebuild the polygon only once, e.g.
+        ``polygon.update(points=points, outline=0xFFFFFF, fill=0xFF0000)``.
+
+        :param props: New values of ``points``, ``outline``, ``fill``, ``close`` and
+                    ``stroke``.
+        """
+        unknown = [name for name in props if name not in self._PROPERTIES]
+        if unknown:
+            raise TypeError("Unknown FilledPolygon properties: " + ", ".join(unknown))
+        self._batching = True
+        try:
+            for name in self._PROPERTIES:
+                if name in props:
+                    setattr(self, name, props[name])
+        finally:
+            self._batching = False
         self._init_polygon()
 
     def _init_polygon(self):
+        if self._batching:
+            return
         # create polygon(s) and add to ourselves
         if HAVE_VECTORIO and self._fill is not None:
             if self.palette is None:
@@ -85,31 +111,47 @@ class FilledPolygon(displayio.Group):
             self.palette[0] = self._fill
             if self.vector_polygon is None:
                 self.vector_polygon = vectorio.Polygon(
-                    pixel_shader=self.palette, points=self.points, x=0, y=0
+                    pixel_shader=self.palette, points=self._vector_points(), x=0, y=0
                 )
                 self.append(self.vector_polygon)
             else:
-                self.vector_polygon.points = self.points
-
-        if self._outline is not None:
-            if self.outline_polygon is None:
-                self.outline_polygon = Polygon(
-                    self.points,
-                    outline=self._outline,
-                    colors=1,
-                    close=self.close,
-                    stroke=self.stroke,
-                )
-            else:
+                self.vector_polygon.points = self._vector_points()
+
+        # without vectorio, the fill is scan converted into the outline bitmap
+        fill = None if HAVE_VECTORIO else self._fill
+        if self._outline is None and fill is None:
+            if self.outline_polygon is not None:
                 self.remove(self.outline_polygon)
-                self.outline_polygon = Polygon(
-                    self.points,
-                    outline=self._outline,
-                    colors=1,
-                    close=self.close,
-                    stroke=self.stroke,
-                )
+                self.outline_polygon = None
+        elif self.outline_polygon is None:
+            self.outline_polygon = Polygon(
+                self.points,
+                outline=self._outline,
+                fill=fill,
+                colors=1 if fill is None else 2,
+                close=self.close,
+                stroke=self.stroke,
+            )
             self.append(self.outline_polygon)
+        else:
+            # redraw into the existing bitmap when possible
+            polygon = self.outline_polygon._update(
+                self.points,
+                outline=self._outline,
+                fill=fill,
+                close=self.close,
+                stroke=self.stroke,
+            )
+            if polygon is not self.outline_polygon:
+                self[self.index(self.outline_polygon)] = polygon
+                self.outline_polygon = polygon
+
+    def _vector_points(self) -> List[Tuple[int, int]]:
+        # vectorio only accepts a list of tuples
+        points = self._points
+        if not Polygon._is_flat(points):
+            return points
+        return [(points[index], points[index + 1]) for index in range(0, len(points), 2)]
 
     @property
     def points(self):
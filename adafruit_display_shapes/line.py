@@ -22,7 +22,7 @@ Implementation Notes
 """
 
 try:
-    from typing import Optional
+    from typing import Optional, Tuple
 except ImportError:
     pass
 
@@ -40,6 +40,12 @@ class Line(Polygon):
     :param int x1: The x-position of the second vertex.
     :param int y1: The y-position of the second vertex.
     :param int color: The color of the line.
+    :param int stroke: (Optional) Thickness of the line, centered on it. (1)
+    :param tuple|None bitmap_size: (Optional) Minimum ``(width, height)`` of the bitmap. A
+                    larger bitmap lets the endpoints be moved further later. (None)
+    :param bool turnable: (Optional) Make the bitmap a square that holds the line moved
+                    anywhere and turned to any angle, as long as it gets no longer, e.g. for
+                    a clock hand. (False)
     """
 
     def __init__(
@@ -49,8 +55,73 @@ class Line(Polygon):
         x1: int,
         y1: int,
         color: int,
+        *,
+        stroke: int = 1,
+        bitmap_size: Optional[Tuple[int, int]] = None,
+        turnable: bool = False,
     ) -> None:
-        super().__init__([(x0, y0), (x1, y1)], outline=color)
+        points = [(x0, y0), (x1, y1)]
+        if turnable:
+            (width, height) = self._turning_size(points, stroke)
+            if bitmap_size is not None:
+                width = max(width, bitmap_size[0])
+                height = max(height, bitmap_size[1])
+            bitmap_size = (width, height)
+        super().__init__(
+            points,
+            outline=color,
+            close=False,
+            stroke=stroke,
+            bitmap_size=bitmap_size,
+        )
+
+    def set_endpoints(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Move both ends of the line at once. The line is redrawn into its bitmap, which
+        has to be large enough to hold it, see ``bitmap_size`` and ``turnable``.
+
+        :param int x0: The x-position of the first vertex.
+        :param int y0: The y-position of the first vertex.
+        :param int x1: The x-position of the second vertex.
+        :param int y1: The y-position of the second vertex.
+        """
+        if (x0, y0, x1, y1) != (self.x0, self.y0, self.x1, self.y1):
+            self.points = [(x0, y0), (x1, y1)]
+
+    @property
+    def x0(self) -> int:
+        """The x-position of the first vertex."""
+        return self._points[0][0]
+
+    @x0.setter
+    def x0(self, value: int) -> None:
+        self.set_endpoints(value, self.y0, self.x1, self.y1)
+
+    @property
+    def y0(self) -> int:
+        """The y-position of the first vertex."""
+        return self._points[0][1]
+
+    @y0.setter
+    def y0(self, value: int) -> None:
+        self.set_endpoints(self.x0, value, self.x1, self.y1)
+
+    @property
+    def x1(self) -> int:
+        """The x-position of the second vertex."""
+        return self._points[1][0]
+
+    @x1.setter
+    def x1(self, value: int) -> None:
+        self.set_endpoints(self.x0, self.y0, value, self.y1)
+
+    @property
+    def y1(self) -> int:
+        """The y-position of the second vertex."""
+        return self._points[1][1]
+
+    @y1.setter
+    def y1(self, value: int) -> None:
+        self.set_endpoints(self.x0, self.y0, self.x1, value)
 
     @property
     def color(self) -> Optional[int]:
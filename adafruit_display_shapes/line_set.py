@@ -0,0 +1,151 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`line_set`
+================================================================================
+
+Various common shapes for use with displayio - Many lines in one bitmap!
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Iterable, List, Optional, Sequence, Tuple
+except ImportError:
+    pass
+
+from adafruit_display_shapes.polygon import Polygon
+from adafruit_display_shapes.shape_set import ShapeSet
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Shapes.git"
+
+
+class LineSet(ShapeSet):
+    """Independent line segments in one bitmap and palette, such as axis grids, tick
+    marks and scale rulers. Segments are drawn in order, so later ones cover earlier
+    ones where they cross.
+
+    :param segments: A flat sequence of ``x0, y0, x1, y1`` values, four per segment,
+                    relative to the top left of the set, such as an ``array("h")``. It is
+                    not copied.
+    :param color_indices: The color of each segment as an index into ``colors`` plus one,
+                    or 0 to hide the segment. It is not copied.
+    :param list colors: The colors of the segments.
+    :param int x: The x-position of the top left corner.
+    :param int y: The y-position of the top left corner.
+    :param int|None width: (Optional) Width of the bitmap. (None to fit the segments)
+    :param int|None height: (Optional) Height of the bitmap. (None to fit the segments)
+    :param int stroke: (Optional) Thickness of the segments, centered on them. (1)
+    """
+
+    def __init__(
+        self,
+        segments: Sequence[int],
+        color_indices: Sequence[int],
+        colors: List[int],
+        *,
+        x: int = 0,
+        y: int = 0,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        stroke: int = 1,
+    ) -> None:
+        (x_offset, y_offset, bounds_width, bounds_height) = Polygon._bounds(segments, stroke)
+        if width is None:
+            width = x_offset + bounds_width
+        if height is None:
+            height = y_offset + bounds_height
+
+        self._segments = segments
+        self._stroke = stroke
+        super().__init__(
+            len(segments) // 4,
+            color_indices,
+            colors,
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+        )
+
+    def _shape_bounds(self, index: int) -> Tuple[int, int, int, int]:
+        return Polygon._bounds(self._segments[4 * index : 4 * index + 4], self._stroke)
+
+    def _draw(self, index: int, clip: Tuple[int, int, int, int]) -> None:
+        Polygon.draw(
+            self._bitmap,
+            self._segments[4 * index : 4 * index + 4],
+            self._color_indices[index],
+            close=False,
+            stroke=self._stroke,
+            clip=clip,
+        )
+
+    def set_segment(
+        self,
+        index: int,
+        x0: int,
+        y0: int,
+        x1: int,
+        y1: int,
+        color_index: Optional[int] = None,
+    ) -> None:
+        """Move one segment and redraw only the area around its old and new position.
+
+        :param int index: The index of the segment.
+        :param int x0: The x-position of the first end.
+        :param int y0: The y-position of the first end.
+        :param int x1: The x-position of the second end.
+        :param int y1: The y-position of the second end.
+        :param int|None color_index: (Optional) The new color index of the segment, 0 to
+                    hide it. (None to keep it)
+        """
+        for i, value in enumerate((x0, y0, x1, y1)):
+            self._segments[4 * index + i] = value
+        if color_index is not None:
+            self._color_indices[index] = color_index
+        self.update((index,))
+
+    def hide_segment(self, index: int) -> None:
+        """Hide one segment, clearing only the area it covered. Show it again with
+        `set_segment` and a color index.
+
+        :param int index: The index of the segment.
+        """
+        self._color_indices[index] = 0
+        self.update((index,))
+
+    def update(self, segments: Optional[Iterable[int]] = None) -> None:
+        """Redraw segments after their ends or color indices were changed in place. Only
+        the area the given segments covered before and cover now is cleared, and the
+        segments crossing it are drawn again, clipped to it.
+
+        :param segments: (Optional) The indices of the changed segments. (None to redraw
+                    all segments)
+        """
+        self._redraw(segments)
+
+    @property
+    def segments(self) -> Sequence[int]:
+        """The ``x0, y0, x1, y1`` values of the segments. Call `update` after changing
+        them."""
+        return self._segments
+
+    @property
+    def color_indices(self) -> Sequence[int]:
+        """The color of each segment as an index into the colors plus one, or 0 if the
+        segment is hidden. Call `update` after changing them."""
+        return self._color_indices
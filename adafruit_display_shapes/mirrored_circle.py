@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`mirrored_circle`
+================================================================================
+
+Various common shapes for use with displayio - Circle shape drawn from one quadrant!
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+import displayio
+
+from adafruit_display_shapes.roundrect import _draw_round_rect
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Shapes.git"
+
+
+class MirroredCircle(displayio.Group):
+    """A circle. Technically, a Group of four TileGrids that show the same quadrant
+    bitmap, flipped into place. It needs about a quarter of the bitmap memory of a
+    `Circle` and takes the same arguments.
+
+    :param int x0: The x-position of the center.
+    :param int y0: The y-position of the center.
+    :param int r: The radius of the circle.
+    :param int|None fill: The color to fill the circle. Can be a hex value for a color or
+                 ``None`` for transparent.
+    :param int|None outline: The outline of the circle. Can be a hex value for a color or
+                 ``None`` for no outline.
+    :param int stroke: Used for the outline. Will not change the radius.
+
+    """
+
+    _FILL = 2
+    _OUTLINE = 1
+
+    def __init__(
+        self,
+        x0: int,
+        y0: int,
+        r: int,
+        *,
+        fill: Optional[int] = None,
+        outline: Optional[int] = None,
+        stroke: int = 1,
+    ) -> None:
+        super().__init__(x=x0 - r, y=y0 - r)
+        self._r = r
+        self._palette = displayio.Palette(3)
+        self._palette.make_transparent(0)
+        # the top left quadrant including the center row and column
+        self._bitmap = displayio.Bitmap(r + 1, r + 1, 3)
+        _draw_round_rect(
+            self._bitmap,
+            2 * r + 1,
+            2 * r + 1,
+            r,
+            stroke if outline is not None else 0,
+            self._FILL,
+            self._OUTLINE,
+        )
+        for flip_x, flip_y in ((False, False), (True, False), (False, True), (True, True)):
+            quadrant = displayio.TileGrid(
+                self._bitmap,
+                pixel_shader=self._palette,
+                x=r if flip_x else 0,
+                y=r if flip_y else 0,
+            )
+            quadrant.flip_x = flip_x
+            quadrant.flip_y = flip_y
+            self.append(quadrant)
+        self.fill = fill
+        self.outline = outline
+
+    @property
+    def fill(self) -> Optional[int]:
+        """The fill of the circle. Can be a hex value for a color or ``None`` for
+        transparent."""
+        return self._palette[self._FILL]
+
+    @fill.setter
+    def fill(self, color: Optional[int]) -> None:
+        if color is None:
+            self._palette[self._FILL] = 0
+            self._palette.make_transparent(self._FILL)
+        else:
+            self._palette[self._FILL] = color
+            self._palette.make_opaque(self._FILL)
+
+    @property
+    def outline(self) -> Optional[int]:
+        """The outline of the circle. Can be a hex value for a color or ``None``
+        for no outline."""
+        return self._palette[self._OUTLINE]
+
+    @outline.setter
+    def outline(self, color: Optional[int]) -> None:
+        if color is None:
+            self._palette[self._OUTLINE] = 0
+            self._palette.make_transparent(self._OUTLINE)
+        else:
+            self._palette[self._OUTLINE] = color
+            self._palette.make_opaque(self._OUTLINE)
+
+    @property
+    def r(self) -> int:
+        """The radius of the circle."""
+        return self._r
+
+    @property
+    def x0(self) -> int:
+        """The x-position of the center of the circle."""
+        return self.x + self._r
+
+    @property
+    def y0(self) -> int:
+        """The y-position of the center of the circle."""
+        return self.y + self._r
+
+    @x0.setter
+    def x0(self, x0: int) -> None:
+        self.x = x0 - self._r
+
+    @y0.setter
+    def y0(self, y0: int) -> None:
+        self.y = y0 - self._r
@@ -27,6 +27,8 @@ try:
     T = TypeVar("T")
 except ImportError:
     pass
+from array import array
+
 import displayio
 
 from adafruit_display_shapes.polygon import Polygon
@@ -128,8 +130,9 @@ class MultiSparkline(displayio.TileGrid):
             _CyclicBuffer(self._max_items, 0.0) for i in range(self._lines)
         ]  # values per sparkline
         self._points = [
-            _CyclicBuffer(self._max_items, (0, 0)) for i in range(self._lines)
-        ]  # _points: all points of sparkline
+            array("h", [0] * (2 * self._max_items)) for i in range(self._lines)
+        ]  # _points: all points of sparkline, interleaved x and y
+        self._point_counts = [0] * self._lines
         self.dyn_xpitch = dyn_xpitch
         if not dyn_xpitch:
             self._xpitch = (width - 1) / (self._max_items - 1)
@@ -209,12 +212,17 @@ class MultiSparkline(displayio.TileGrid):
             y = int(0.5 * self.height)
         else:
             y = int((self.height - 1) * (top - value) / (top - bottom))
-        self._points[line].push((x, y))
+        index = 2 * self._point_counts[line]
+        self._points[line][index] = x
+        # far out of range values are off the chart either way
+        self._points[line][index + 1] = max(-32768, min(y, 32767))
+        self._point_counts[line] += 1
 
     def _draw(self) -> None:
         self._bitmap.fill(0)
         for i in range(self._lines):
-            Polygon.draw(self._bitmap, self._points[i].values(), i + 1, close=False)
+            points = memoryview(self._points[i])[: 2 * self._point_counts[i]]
+            Polygon.draw(self._bitmap, points, i + 1, close=False)
 
     def update_line(self, line: int = None) -> None:
         """Update the drawing of the sparkline.
@@ -240,7 +248,7 @@ class MultiSparkline(displayio.TileGrid):
             else:
                 xpitch = self._xpitch
 
-            self._points[a_line].clear()  # remove all points
+            self._point_counts[a_line] = 0  # remove all points
 
             for count, value in enumerate(self._buffers[a_line].values()):
                 self._add_point(a_line, int(xpitch * count), value)
@@ -22,10 +22,14 @@ Implementation Notes
 """
 
 try:
-    from typing import List, Optional, Tuple
+    from typing import List, Optional, Sequence, Tuple, Union
+
+    Points = Union[List[Tuple[int, int]], Sequence[int]]
 except ImportError:
     pass
 
+import math
+
 import bitmaptools
 import displayio
 
@@ -36,157 +40,639 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Shapes.gi
 class Polygon(displayio.TileGrid):
     """A polygon.
 
-    :param list points: A list of (x, y) tuples of the points
+    :param list points: A list of (x, y) tuples of the points, or a flat sequence of
+                    interleaved x and y values such as an ``array("h")``. It is not copied.
     :param int|None outline: The outline of the polygon. Can be a hex value for a color or
                     ``None`` for no outline.
+    :param int|None fill: The color to fill the polygon. Can be a hex value for a color or
+                    ``None`` for transparent.
     :param bool close: (Optional) Wether to connect first and last point. (True)
     :param int colors: (Optional) Number of colors to use. Most polygons would use two, one for
                     outline and one for fill. If you're not filling your polygon, set this to 1
                     for smaller memory footprint. (2)
-    :param int stroke: Thickness of the outline.
+    :param int stroke: Thickness of the outline. Thick outlines are centered on the
+                    points, with mitered (or beveled, for sharp angles) joins.
+    :param bool even_odd: (Optional) Fill self-intersecting polygons using the even-odd rule
+                    instead of the non-zero winding rule. (False)
+    :param tuple|None bitmap_size: (Optional) Minimum ``(width, height)`` of the bitmap. A
+                    larger bitmap lets ``points`` be changed later to a larger shape. (None)
     """
 
     _OUTLINE = 1
     _FILL = 2
+    # sharper joins than this ratio of miter length to stroke are beveled
+    _MITER_LIMIT = 2
 
     def __init__(
         self,
-        points: List[Tuple[int, int]],
+        points: Points,
         *,
         outline: Optional[int] = None,
+        fill: Optional[int] = None,
         close: Optional[bool] = True,
         colors: Optional[int] = 2,
         stroke: int = 1,
+        even_odd: bool = False,
+        bitmap_size: Optional[Tuple[int, int]] = None,
     ) -> None:
-        (x_s, y_s) = zip(*points)
-
-        x_offset = min(x_s)
-        y_offset = min(y_s)
+        if fill is not None:
+            colors = max(colors, 2)
 
-        # Find the largest and smallest X values to figure out width for bitmap
-        width = max(x_s) - min(x_s) + 1
-        height = max(y_s) - min(y_s) + 1
+        (x_offset, y_offset, width, height) = self._bounds(points, stroke)
+        if bitmap_size is not None:
+            width = max(width, bitmap_size[0])
+            height = max(height, bitmap_size[1])
 
         self._palette = displayio.Palette(colors + 1)
         self._palette.make_transparent(0)
-        self._bitmap = displayio.Bitmap(width + stroke, height + stroke, colors + 1)
+        self._bitmap = displayio.Bitmap(width, height, colors + 1)
         self._stroke = stroke
-
-        shifted = [(x - x_offset, y - y_offset) for (x, y) in points]
-
+        self._close = close
+        self._even_odd = even_odd
+        self._filled = fill is not None
+        self._outlined = outline is not None
+        self._points = points
+        self._extent = (0, 0)
+
+        if fill is not None:
+            self.fill = fill
         if outline is not None:
             self.outline = outline
-            self.draw(self._bitmap, shifted, self._OUTLINE, close, stroke)
+        self._redraw(x_offset, y_offset)
 
         super().__init__(self._bitmap, pixel_shader=self._palette, x=x_offset, y=y_offset)
 
+    @staticmethod
+    def _bounds(points: Points, stroke: int) -> Tuple[int, int, int, int]:
+        # position and size of the bitmap area the points are drawn into
+        flat = Polygon._is_flat(points)
+        (x_min, y_min) = (x_max, y_max) = Polygon._vertex(points, 0)
+        for index in range(len(points) // 2 if flat else len(points)):
+            if flat:
+                x = points[2 * index]
+                y = points[2 * index + 1]
+            else:
+                (x, y) = points[index]
+            x_min = min(x_min, x)
+            x_max = max(x_max, x)
+            y_min = min(y_min, y)
+            y_max = max(y_max, y)
+        # thick outlines reach at most one stroke (a miter at the limit) past the points
+        pad = stroke if stroke > 1 else 0
+        return (
+            x_min - pad,
+            y_min - pad,
+            x_max - x_min + 1 + 2 * pad,
+            y_max - y_min + 1 + 2 * pad,
+        )
+
+    @staticmethod
+    def _turning_size(points: List[Tuple[int, int]], stroke: int) -> Tuple[int, int]:
+        # A square bitmap that holds the points turned to any angle: no two of them
+        # are further apart than the longest distance between any pair, plus a
+        # pixel for rounding the turned points.
+        span = 0
+        for index, (x_0, y_0) in enumerate(points):
+            for x_1, y_1 in points[index + 1 :]:
+                span = max(span, math.sqrt((x_1 - x_0) ** 2 + (y_1 - y_0) ** 2))
+        pad = stroke if stroke > 1 else 0
+        size = int(span) + 2 + 2 * pad
+        return (size, size)
+
+    @staticmethod
+    def _is_flat(points: Points) -> bool:
+        return len(points) > 0 and isinstance(points[0], int)
+
+    @staticmethod
+    def _vertex(
+        points: Points,
+        index: int,
+        offset: Tuple[int, int] = (0, 0),
+    ) -> Tuple[int, int]:
+        # point index of either a list of tuples or a flat interleaved sequence
+        if isinstance(points[0], int):
+            return (points[2 * index] + offset[0], points[2 * index + 1] + offset[1])
+        return (points[index][0] + offset[0], points[index][1] + offset[1])
+
+    def _fits(self, points: Points) -> bool:
+        (_, _, width, height) = self._bounds(points, self._stroke)
+        return width <= self._bitmap.width and height <= self._bitmap.height
+
+    def _redraw(self, x_offset: int, y_offset: int) -> None:
+        # clear what was drawn last time and draw the points shifted by the offset
+        if self._extent[0]:
+            bitmaptools.fill_region(self._bitmap, 0, 0, self._extent[0], self._extent[1], 0)
+        (_, _, width, height) = self._bounds(self._points, self._stroke)
+        self._extent = (width, height)
+
+        self._draw_points((-x_offset, -y_offset))
+
+    def _draw_points(self, offset: Tuple[int, int]) -> None:
+        if self._filled:
+            self.draw_filled(self._bitmap, self._points, self._FILL, self._even_odd, offset=offset)
+        if self._outlined:
+            self.draw(
+                self._bitmap,
+                self._points,
+                self._OUTLINE,
+                self._close,
+                self._stroke,
+                offset=offset,
+            )
+
+    def _update(
+        self,
+        points: Points,
+        *,
+        outline: Optional[int],
+        fill: Optional[int],
+        close: bool,
+        stroke: int,
+    ) -> "Polygon":
+        # Used by shapes that own a Polygon. Redraws in place when the bitmap can be
+        # reused, otherwise returns a replacement whose bitmap has room to grow.
+        # The outline has a palette slot either way; whether it is drawn has to
+        # follow it, or a hidden outline cuts into the fill.
+        if (
+            stroke == self._stroke
+            and close == self._close
+            and (fill is None or self._filled)
+            and self._fits(points)
+        ):
+            self._outlined = outline is not None
+            self.outline = outline
+            if self._filled:
+                self.fill = fill
+            self.points = points
+            return self
+        (_, _, width, height) = self._bounds(points, stroke)
+        return Polygon(
+            points,
+            outline=outline,
+            fill=fill,
+            colors=1 if fill is None else 2,
+            close=close,
+            stroke=stroke,
+            even_odd=self._even_odd,
+            bitmap_size=(
+                max(self._bitmap.width, width + width // 4),
+                max(self._bitmap.height, height + height // 4),
+            ),
+        )
+
     @staticmethod
     def draw(
         bitmap: displayio.Bitmap,
-        points: List[Tuple[int, int]],
+        points: Points,
         color_id: int,
         close: Optional[bool] = True,
         stroke=1,
+        clip: Optional[Tuple[int, int, int, int]] = None,
+        offset: Tuple[int, int] = (0, 0),
     ) -> None:
         """Draw a polygon conecting points on provided bitmap with provided color_id
 
         :param displayio.Bitmap bitmap: bitmap to draw on
-        :param list points: A list of (x, y) tuples of the points
+        :param list points: A list of (x, y) tuples of the points, or a flat sequence of
+                        interleaved x and y values such as an ``array("h")``
         :param int color_id: Color to draw with
         :param bool close: (Optional) Wether to connect first and last point. (True)
+        :param int stroke: (Optional) Thickness of the lines. (1)
+        :param tuple|None clip: (Optional) Only draw inside this ``(x0, y0, x1, y1)``
+                        rectangle of the bitmap, ``x1`` and ``y1`` exclusive. Drawing is
+                        always clipped to the bitmap. (None)
+        :param tuple offset: (Optional) ``(x, y)`` added to every point. ((0, 0))
         """
 
-        if close:
-            points.append(points[0])
+        clip = Polygon._clip_to(bitmap, clip)
+        if stroke > 1:
+            Polygon._stroke_on(bitmap, points, color_id, close, stroke, clip, offset)
+            return
 
-        for index in range(len(points) - 1):
-            Polygon._line_on(bitmap, points[index], points[index + 1], color_id, stroke)
+        Polygon._lines_on(bitmap, points, color_id, close, clip, offset)
 
-    def _line(
-        self,
+    @staticmethod
+    def draw_filled(
+        bitmap: displayio.Bitmap,
+        points: Points,
+        color_id: int,
+        even_odd: bool = False,
+        clip: Optional[Tuple[int, int, int, int]] = None,
+        offset: Tuple[int, int] = (0, 0),
+    ) -> None:
+        """Fill a polygon defined by points on provided bitmap with provided color_id.
+        A pixel is filled when its center lies inside the polygon.
+
+        :param displayio.Bitmap bitmap: bitmap to draw on
+        :param list points: A list of (x, y) tuples of the points, or a flat sequence of
+                        interleaved x and y values such as an ``array("h")``
+        :param int color_id: Color to fill with
+        :param bool even_odd: (Optional) Use the even-odd rule instead of the non-zero
+                        winding rule for self-intersecting polygons. (False)
+        :param tuple|None clip: (Optional) Only draw inside this ``(x0, y0, x1, y1)``
+                        rectangle of the bitmap, ``x1`` and ``y1`` exclusive. Drawing is
+                        always clipped to the bitmap. (None)
+        :param tuple offset: (Optional) ``(x, y)`` added to every point. ((0, 0))
+        """
+
+        (lo_x, lo_y, hi_x, hi_y) = Polygon._clip_to(bitmap, clip)
+
+        edges = Polygon._edges(points, offset)
+        if not edges:
+            return
+
+        active = []
+        soonest = hi_y
+        pending = 0
+        for row in range(max(edges[0][0], lo_y), hi_y):
+            while pending < len(edges) and edges[pending][0] <= row:
+                active.append(edges[pending])
+                soonest = min(soonest, edges[pending][1])
+                pending += 1
+            if row >= soonest:
+                active = [edge for edge in active if edge[1] > row]
+                soonest = min((edge[1] for edge in active), default=hi_y)
+            if not active:
+                if pending == len(edges):
+                    return
+                continue
+
+            # where each active edge crosses the pixel centers of this row, rounded up
+            crossings = sorted(
+                (edge[2] - (edge[0] - row) * edge[3] // (edge[1] - edge[0]), edge[4])
+                for edge in active
+            )
+            winding = 0
+            for x, direction in crossings:
+                if not winding:
+                    left = x
+                winding = (winding + 1) % 2 if even_odd else winding + direction
+                if not winding:
+                    start = max(left, lo_x)
+                    end = min(x, hi_x)
+                    if start < end:
+                        bitmaptools.fill_region(bitmap, start, row, end, row + 1, color_id)
+
+    @staticmethod
+    def _edges(
+        points: Points,
+        offset: Tuple[int, int],
+    ) -> List[Tuple[int, int, int, int, int]]:
+        # edge table of (first row, end row, x at first row, x span, winding direction)
+        edges = []
+        count = len(points) // 2 if Polygon._is_flat(points) else len(points)
+        (x_1, y_1) = Polygon._vertex(points, count - 1, offset) if count else (0, 0)
+        for index in range(count):
+            (x_0, y_0) = (x_1, y_1)
+            (x_1, y_1) = Polygon._vertex(points, index, offset)
+            if y_0 < y_1:
+                edges.append((y_0, y_1, x_0, x_1 - x_0, 1))
+            elif y_1 < y_0:
+                edges.append((y_1, y_0, x_1, x_0 - x_1, -1))
+        edges.sort()
+        return edges
+
+    @staticmethod
+    def _lines_on(
+        bitmap: displayio.Bitmap,
+        points: Points,
+        color: int,
+        close: bool,
+        clip: Tuple[int, int, int, int],
+        offset: Tuple[int, int],
+    ) -> None:
+        # single pixel lines between the points, read in place without building tuples
+        flat = Polygon._is_flat(points)
+        count = len(points) // 2 if flat else len(points)
+        if not count:
+            return
+        (x_1, y_1) = Polygon._vertex(points, 0, offset)
+        for index in range(1, count + 1 if close else count):
+            (x_0, y_0) = (x_1, y_1)
+            vertex = index % count
+            if flat:
+                x_1 = points[2 * vertex] + offset[0]
+                y_1 = points[2 * vertex + 1] + offset[1]
+            else:
+                (x_1, y_1) = points[vertex]
+                x_1 += offset[0]
+                y_1 += offset[1]
+            Polygon._segment_on(bitmap, x_0, y_0, x_1, y_1, color, clip)
+
+    @staticmethod
+    def _clip_to(
+        bitmap: displayio.Bitmap,
+        clip: Optional[Tuple[int, int, int, int]],
+    ) -> Tuple[int, int, int, int]:
+        if clip is None:
+            return (0, 0, bitmap.width, bitmap.height)
+        return (
+            max(clip[0], 0),
+            max(clip[1], 0),
+            min(clip[2], bitmap.width),
+            min(clip[3], bitmap.height),
+        )
+
+    @staticmethod
+    def _segment_on(
+        bitmap: displayio.Bitmap,
         x_0: int,
         y_0: int,
         x_1: int,
         y_1: int,
         color: int,
+        clip: Tuple[int, int, int, int],
     ) -> None:
-        self._line_on(self._bitmap, (x_0, y_0), (x_1, y_1), color)
+        # Bresenham along the major axis, which becomes x from here on
+        steep = abs(y_1 - y_0) > abs(x_1 - x_0)
+        if steep:
+            x_0, y_0 = y_0, x_0
+            x_1, y_1 = y_1, x_1
+            clip = (clip[1], clip[0], clip[3], clip[2])
+
+        if x_0 > x_1:
+            x_0, x_1 = x_1, x_0
+            y_0, y_1 = y_1, y_0
+
+        Polygon._runs_on(bitmap, (x_0, y_0), x_1 - x_0, y_1 - y_0, steep, color, clip)
 
     @staticmethod
-    def _safe_draw(
+    def _runs_on(
         bitmap: displayio.Bitmap,
-        point: Tuple[int, int],
+        start: Tuple[int, int],
+        d_x: int,
+        d_y: int,
+        steep: bool,
         color: int,
+        clip: Tuple[int, int, int, int],
     ) -> None:
-        (x, y) = point
-        if 0 <= x < bitmap.width and 0 <= y < bitmap.height:
-            bitmap[x, y] = color
+        # One iteration per run of pixels along the major axis instead of one per
+        # pixel, each run written with a single fill.
+        (x_0, y_0) = start
+        ystep = 1 if d_y > 0 else -1
+        d_y = abs(d_y)
+        (first, last) = Polygon._visible_run(x_0, y_0, d_x, d_y, ystep, clip)
+        if first > last:
+            return
+
+        # error term and minor position at the first visible pixel
+        err = 0
+        if d_x:
+            err = (d_x // 2 - (first - x_0) * d_y) % d_x
+            y_0 -= ystep * ((d_x // 2 - (first - x_0) * d_y) // d_x)
+
+        x = first
+        while x <= last:
+            if d_y:
+                end = min(x + err // d_y, last)
+                err += d_x - (end - x + 1) * d_y
+            else:
+                end = last
+            if end == x:
+                if steep:
+                    bitmap[y_0, x] = color
+                else:
+                    bitmap[x, y_0] = color
+            elif steep:
+                bitmaptools.fill_region(bitmap, y_0, x, y_0 + 1, end + 1, color)
+            else:
+                bitmaptools.fill_region(bitmap, x, y_0, end + 1, y_0 + 1, color)
+            x = end + 1
+            y_0 += ystep
+
+    @staticmethod
+    def _visible_run(
+        x_0: int,
+        y_0: int,
+        d_x: int,
+        d_y: int,
+        ystep: int,
+        clip: Tuple[int, int, int, int],
+    ) -> Tuple[int, int]:
+        # Clip against the major axis directly, and against the minor axis via the
+        # first and last run that are inside. Run j > 0 starts at
+        # x_0 + ((j - 1) * d_x + d_x // 2) // d_y + 1, so the visible pixels are
+        # exactly those the unclipped line would have drawn.
+        first = max(x_0, clip[0])
+        last = min(x_0 + d_x, clip[2] - 1)
+        if not d_y:
+            if not clip[1] <= y_0 < clip[3]:
+                return (1, 0)
+            return (first, last)
+        if ystep > 0:
+            (run_0, run_1) = (clip[1] - y_0, clip[3] - 1 - y_0)
+        else:
+            (run_0, run_1) = (y_0 - clip[3] + 1, y_0 - clip[1])
+        if run_0 > 0:
+            first = max(first, x_0 + ((run_0 - 1) * d_x + d_x // 2) // d_y + 1)
+        if run_1 < d_y:
+            last = min(last, x_0 + (run_1 * d_x + d_x // 2) // d_y)
+        return (first, last)
 
     @staticmethod
-    def _line_on(
+    def _stroke_on(
         bitmap: displayio.Bitmap,
-        p_0: Tuple[int, int],
-        p_1: Tuple[int, int],
+        points: Points,
         color: int,
-        stroke: int = 1,
+        close: bool,
+        stroke: int,
+        clip: Tuple[int, int, int, int],
+        offset: Tuple[int, int] = (0, 0),
     ) -> None:
-        (x_0, y_0) = p_0
-        (x_1, y_1) = p_1
-
-        def pt_on(x, y, pt_size=1):
-            if pt_size > 1:
-                x += pt_size // 2
-                y += pt_size // 2
-                bitmaptools.fill_region(
-                    bitmap,
-                    x - (pt_size // 2),
-                    y - (pt_size // 2),
-                    x + (pt_size // 2),
-                    y + (pt_size // 2),
-                    color,
-                )
+        # Every segment becomes a quad of width stroke centered on it. Vertices get a
+        # miter or bevel wedge on their outer side, open ends get square caps.
+        half = stroke / 2
+        count = len(points) // 2 if Polygon._is_flat(points) else len(points)
+        if not count:
+            return
+        close = close and count > 2
+        first = None
+        prev = None
+        (x_1, y_1) = Polygon._vertex(points, 0, offset)
+        for index in range(1, count + 1 if close else count):
+            (x_0, y_0) = (x_1, y_1)
+            (x_1, y_1) = Polygon._vertex(points, index % count, offset)
+            length = math.sqrt((x_1 - x_0) ** 2 + (y_1 - y_0) ** 2)
+            if not length:
+                continue
+            u_x = (x_1 - x_0) / length
+            u_y = (y_1 - y_0) / length
+            n_x = -u_y * half
+            n_y = u_x * half
+            if prev is None:
+                first = (u_x, u_y)
+                if not close:
+                    Polygon._cap_on(bitmap, (x_0, y_0), -u_x, -u_y, half, color, clip)
             else:
-                Polygon._safe_draw(bitmap, (x, y), color)
-
-        if x_0 == x_1:
-            if y_0 > y_1:
-                y_0, y_1 = y_1, y_0
-            for _h in range(y_0, y_1 + 1):
-                pt_on(x_0, _h, stroke)
-        elif y_0 == y_1:
-            if x_0 > x_1:
-                x_0, x_1 = x_1, x_0
-            for _w in range(x_0, x_1 + 1):
-                pt_on(_w, y_0, stroke)
+                Polygon._join_on(bitmap, (x_0, y_0), prev, (u_x, u_y), half, color, clip)
+            Polygon._fill_convex(
+                bitmap,
+                (
+                    (x_0 + n_x, y_0 + n_y),
+                    (x_1 + n_x, y_1 + n_y),
+                    (x_1 - n_x, y_1 - n_y),
+                    (x_0 - n_x, y_0 - n_y),
+                ),
+                color,
+                clip,
+            )
+            prev = (u_x, u_y)
+
+        if prev is None:
+            # all points coincide, draw a single square dot
+            (x_0, y_0) = Polygon._vertex(points, 0, offset)
+            Polygon._fill_convex(
+                bitmap,
+                (
+                    (x_0 - half, y_0 - half),
+                    (x_0 + half, y_0 - half),
+                    (x_0 + half, y_0 + half),
+                    (x_0 - half, y_0 + half),
+                ),
+                color,
+                clip,
+            )
+        elif close:
+            Polygon._join_on(
+                bitmap, Polygon._vertex(points, 0, offset), prev, first, half, color, clip
+            )
         else:
-            steep = abs(y_1 - y_0) > abs(x_1 - x_0)
-            if steep:
-                x_0, y_0 = y_0, x_0
-                x_1, y_1 = y_1, x_1
+            Polygon._cap_on(bitmap, (x_1, y_1), prev[0], prev[1], half, color, clip)
 
-            if x_0 > x_1:
-                x_0, x_1 = x_1, x_0
-                y_0, y_1 = y_1, y_0
+    @staticmethod
+    def _cap_on(
+        bitmap: displayio.Bitmap,
+        point: Tuple[int, int],
+        u_x: float,
+        u_y: float,
+        half: float,
+        color: int,
+        clip: Tuple[int, int, int, int],
+    ) -> None:
+        # square cap reaching half a stroke past point in direction (u_x, u_y)
+        (x, y) = point
+        n_x = -u_y * half
+        n_y = u_x * half
+        e_x = u_x * half
+        e_y = u_y * half
+        Polygon._fill_convex(
+            bitmap,
+            (
+                (x + n_x, y + n_y),
+                (x + n_x + e_x, y + n_y + e_y),
+                (x - n_x + e_x, y - n_y + e_y),
+                (x - n_x, y - n_y),
+            ),
+            color,
+            clip,
+        )
 
-            d_x = x_1 - x_0
-            d_y = abs(y_1 - y_0)
+    @staticmethod
+    def _join_on(
+        bitmap: displayio.Bitmap,
+        point: Tuple[int, int],
+        u_0: Tuple[float, float],
+        u_1: Tuple[float, float],
+        half: float,
+        color: int,
+        clip: Tuple[int, int, int, int],
+    ) -> None:
+        # fill the wedge between two segment quads on the outer side of the turn
+        (x, y) = point
+        cos = u_0[0] * u_1[0] + u_0[1] * u_1[1]
+        cross = u_0[0] * u_1[1] - u_0[1] * u_1[0]
+        if not cross:
+            return
+        side = -half if cross > 0 else half
+        (a_x, a_y) = (x - u_0[1] * side, y + u_0[0] * side)
+        (b_x, b_y) = (x - u_1[1] * side, y + u_1[0] * side)
+        if 1 + cos >= 2 / Polygon._MITER_LIMIT**2:
+            # the miter point lies on the bisector of both outer edges
+            scale = 1 / (1 + cos)
+            m_x = x + (a_x + b_x - 2 * x) * scale
+            m_y = y + (a_y + b_y - 2 * y) * scale
+            corners = ((x, y), (a_x, a_y), (m_x, m_y), (b_x, b_y))
+        else:
+            corners = ((x, y), (a_x, a_y), (b_x, b_y))
+        Polygon._fill_convex(bitmap, corners, color, clip)
 
-            err = d_x / 2
+    @staticmethod
+    def _fill_convex(
+        bitmap: displayio.Bitmap,
+        corners: Tuple[Tuple[float, float], ...],
+        color: int,
+        clip: Tuple[int, int, int, int],
+    ) -> None:
+        # Scan convert a convex polygon. A pixel is set when its center (x, y) is
+        # inside, with left and top edges inclusive so shared edges never overlap
+        # or leave gaps.
+        (lo_x, lo_y, hi_x, hi_y) = clip
+        if (
+            max(corner[0] for corner in corners) < lo_x
+            or min(corner[0] for corner in corners) >= hi_x
+        ):
+            return
+        top = max(math.ceil(min(corner[1] for corner in corners)), lo_y)
+        bottom = min(math.ceil(max(corner[1] for corner in corners)), hi_y)
+        count = len(corners)
+        for row in range(top, bottom):
+            left = math.inf
+            right = -math.inf
+            (x_0, y_0) = corners[-1]
+            for index in range(count):
+                (x_1, y_1) = corners[index]
+                if y_0 <= row < y_1 or y_1 <= row < y_0:
+                    x = x_0 + (row - y_0) * (x_1 - x_0) / (y_1 - y_0)
+                    left = min(left, x)
+                    right = max(right, x)
+                (x_0, y_0) = (x_1, y_1)
+            if left < right:
+                left = max(math.ceil(left), lo_x)
+                right = min(math.ceil(right), hi_x)
+                if left < right:
+                    bitmaptools.fill_region(bitmap, left, row, right, row + 1, color)
 
-            if y_0 < y_1:
-                ystep = 1
-            else:
-                ystep = -1
+    @property
+    def points(self) -> Points:
+        """The points of the polygon. They are redrawn into the existing bitmap, which
+        has to be large enough to hold them."""
+        return self._points
+
+    @points.setter
+    def points(self, points: Points) -> None:
+        if not self._fits(points):
+            raise ValueError("Points do not fit into the bitmap of the polygon.")
+        (x_offset, y_offset, _, _) = self._bounds(points, self._stroke)
+        self._points = points
+        self._redraw(x_offset, y_offset)
+        self.x = x_offset
+        self.y = y_offset
 
-            for x in range(x_0, x_1 + 1):
-                if steep:
-                    pt_on(y_0, x, stroke)
-                else:
-                    pt_on(x, y_0, stroke)
-                err -= d_y
-                if err < 0:
-                    y_0 += ystep
-                    err += d_x
+    @property
+    def fill(self) -> Optional[int]:
+        """The fill of the polygon. Can be a hex value for a color or
+        ``None`` for transparent. Always ``None`` for a polygon created with
+        ``colors=1``, which has no palette slot for a fill."""
+        if len(self._palette) <= self._FILL:
+            return None
+        return self._palette[self._FILL]
+
+    @fill.setter
+    def fill(self, color: Optional[int]) -> None:
+        if len(self._palette) <= self._FILL:
+            if color is None:
+                return
+            raise ValueError("Polygon has no color for a fill, create it with colors=2.")
+        if color is None:
+            self._palette[self._FILL] = 0
+            self._palette.make_transparent(self._FILL)
+        else:
+            self._palette[self._FILL] = color
+            self._palette.make_opaque(self._FILL)
+            if not self._filled:
+                # created without a fill, so none has been drawn yet
+                self._filled = True
+                self._redraw(self.x, self.y)
 
     @property
     def outline(self) -> Optional[int]:
@@ -26,6 +26,9 @@ try:
 except ImportError:
     pass
 
+import math
+
+import bitmaptools
 import displayio
 
 __version__ = "0.0.0+auto.0"
@@ -45,9 +48,19 @@ class Rect(displayio.TileGrid):
                     ``None`` for no outline.
     :param int stroke: Used for the outline. Will not change the outer bound size set by ``width``
                     and ``height``.
+    :param int|None max_width: (Optional) The largest width the rectangle can be changed to
+                    later. (None for ``width``)
+    :param int|None max_height: (Optional) The largest height the rectangle can be changed to
+                    later. (None for ``height``)
+    :param int|None max_stroke: (Optional) The largest stroke the outline can be changed to
+                    later. (None for ``stroke``)
 
     """
 
+    _FILL = 0
+    _OUTLINE = 1
+    _CLEAR = 2
+
     def __init__(
         self,
         x: int,
@@ -58,72 +71,258 @@ class Rect(displayio.TileGrid):
         fill: Optional[int] = None,
         outline: Optional[int] = None,
         stroke: int = 1,
+        max_width: Optional[int] = None,
+        max_height: Optional[int] = None,
+        max_stroke: Optional[int] = None,
     ) -> None:
         if width <= 0 or height <= 0:
             raise ValueError("Rectangle dimensions must be larger than 0.")
+        self._max_stroke = stroke if max_stroke is None else max_stroke
+        if stroke > self._max_stroke:
+            raise ValueError("Stroke cannot exceed max_stroke.")
+        self._max_width = width if max_width is None else max_width
+        self._max_height = height if max_height is None else max_height
+        if width > self._max_width or height > self._max_height:
+            raise ValueError("Rectangle dimensions cannot exceed max_width and max_height.")
+
+        self._width = width
+        self._height = height
+        self._stroke = stroke
+        self._outlined = outline is not None
+        self._palette = displayio.Palette(3)
+        self._palette.make_transparent(self._CLEAR)
+        self._init_tiles(x, y)
+        self.fill = fill
+        self.outline = outline
+
+    def _init_tiles(self, x: int, y: int) -> None:
+        # Only the border carries information. The bitmap holds the shape
+        # squeezed to at most 4x4 tiles: the near edge, one middle tile and
+        # up to two tiles for the far edge (which may end in a partial tile).
+        # The TileGrid repeats the middle tiles to give the full size, and
+        # resizing mostly comes down to a new tile layout. The grid is sized for
+        # the largest size the shape may grow to, the tiles for the largest extent.
+        extent = self._max_extent()
+        self._tile = self._tile_size(self._max_width, self._max_height, extent)
+        (tile_width, tile_height) = self._tile
+        slots = 4 if self._outlined or extent else 2
+        columns = -(-self._max_width // tile_width)
+        rows = -(-self._max_height // tile_height)
+        self._stride = min(columns, slots)
+        self._band = min(rows, slots)
+        # one more row holds a clear tile for the columns and rows that a
+        # smaller size leaves unused
+        self._bitmap = displayio.Bitmap(
+            tile_width * self._stride,
+            tile_height * (self._band + (1 if columns * rows > 1 else 0)),
+            3,
+        )
+        if self._CLEAR:
+            self._bitmap.fill(self._CLEAR)
+        self._columns = [None] * columns
+        self._rows = [None] * rows
+        self._drawn = (0, 0)
+
+        layout = self._fit()
+        middle_x = layout[0][len(layout[0]) // 2]
+        middle_y = layout[1][len(layout[1]) // 2]
+        self._columns = [middle_x] * columns
+        self._rows = [middle_y] * rows
+        super().__init__(
+            self._bitmap,
+            pixel_shader=self._palette,
+            width=columns,
+            height=rows,
+            tile_width=tile_width,
+            tile_height=tile_height,
+            default_tile=middle_y * self._stride + middle_x,
+            x=x,
+            y=y,
+        )
+        self._apply(layout)
+
+    def _fit(self) -> tuple:
+        extent = self._extent()
+        (columns, width) = self._slices(self._width, self._tile[0], extent)
+        (rows, height) = self._slices(self._height, self._tile[1], extent)
+        if (
+            len(columns) > len(self._columns)
+            or len(rows) > len(self._rows)
+            or max(columns) >= self._stride
+            or max(rows) >= self._band
+        ):
+            raise ValueError("Rectangle does not fit into its tiles.")
+        return (columns, rows, width, height)
+
+    def _apply(self, layout: tuple) -> None:
+        (columns, rows, width, height) = layout
+        drawn = (width, height) + self._shape_key()
+        if drawn != self._drawn:
+            bitmaptools.fill_region(self._bitmap, 0, 0, self._drawn[0], self._drawn[1], self._CLEAR)
+            self._draw(width, height)
+            # strokes wider than the shape spill over its edges
+            (bitmap_width, bitmap_height) = (self._bitmap.width, self._bitmap.height)
+            bitmaptools.fill_region(self._bitmap, width, 0, bitmap_width, height, self._CLEAR)
+            bitmaptools.fill_region(
+                self._bitmap, 0, height, bitmap_width, bitmap_height, self._CLEAR
+            )
+            self._drawn = drawn
+
+        # only rewrite the tiles whose column or row changed
+        columns += [None] * (len(self._columns) - len(columns))
+        rows += [None] * (len(self._rows) - len(rows))
+        changed = [column for column, slot in enumerate(columns) if slot != self._columns[column]]
+        clear = self._band * self._stride
+        for row, slot_y in enumerate(rows):
+            for column in range(len(columns)) if slot_y != self._rows[row] else changed:
+                slot_x = columns[column]
+                if slot_x is None or slot_y is None:
+                    self[column, row] = clear
+                else:
+                    self[column, row] = slot_y * self._stride + slot_x
+        self._columns = columns
+        self._rows = rows
+
+    def _reshape(self, name: str, value: int) -> None:
+        # the tiles are fixed at construction, so a new size or stroke only
+        # takes effect if the squeezed shape still fits them
+        old = getattr(self, name)
+        setattr(self, name, value)
+        try:
+            layout = self._fit()
+        except ValueError:
+            setattr(self, name, old)
+            raise
+        self._apply(layout)
+
+    def _shape_key(self) -> tuple:
+        # everything besides the drawn size that the bitmap depends on
+        return (self._stroke, self._extent())
+
+    def _extent(self) -> int:
+        # how far the edge pattern reaches in from each side
+        return self._stroke if self._outlined else 0
 
-        self._bitmap = displayio.Bitmap(width, height, 2)
-        self._palette = displayio.Palette(2)
-
-        if outline is not None:
-            self._palette[1] = outline
-            for w in range(width):
-                for line in range(stroke):
-                    self._bitmap[w, line] = 1
-                    self._bitmap[w, height - 1 - line] = 1
-            for _h in range(height):
-                for line in range(stroke):
-                    self._bitmap[line, _h] = 1
-                    self._bitmap[width - 1 - line, _h] = 1
-
-        if fill is not None:
-            self._palette[0] = fill
-            self._palette.make_opaque(0)
+    def _max_extent(self) -> int:
+        # the largest extent the shape may be changed to
+        return self._max_stroke if self._outlined else 0
+
+    def _draw(self, width: int, height: int) -> None:
+        bitmaptools.fill_region(self._bitmap, 0, 0, width, height, self._FILL)
+        if self._outlined:
+            stroke = self._stroke
+            for x_1, y_1, x_2, y_2 in (
+                (0, 0, width, stroke),
+                (0, height - stroke, width, height),
+                (0, 0, stroke, height),
+                (width - stroke, 0, width, height),
+            ):
+                bitmaptools.fill_region(
+                    self._bitmap, max(x_1, 0), max(y_1, 0), x_2, y_2, self._OUTLINE
+                )
+
+    @staticmethod
+    def _slices(size: int, tile: int, extent: int) -> tuple:
+        # Bitmap tile column (or row) for each column of the grid, and the
+        # size of the shape as drawn into the bitmap.
+        count = -(-size // tile)
+        end = size - (count - 1) * tile
+        lead = 1 if extent else 0
+        if end < extent:
+            tail = 2
         else:
-            self._palette[0] = 0
-            self._palette.make_transparent(0)
-        super().__init__(self._bitmap, pixel_shader=self._palette, x=x, y=y)
+            tail = 1 if extent or end < tile else 0
+        if count <= lead + 1 + tail:
+            return (list(range(count)), size)
+        if tile < extent:
+            raise ValueError("Rectangle does not fit into its tiles.")
+        slots = [lead] * count
+        for i in range(lead):
+            slots[i] = i
+        for i in range(tail):
+            slots[count - tail + i] = lead + 1 + i
+        return (slots, size - (count - lead - 1 - tail) * tile)
+
+    @staticmethod
+    def _tile_size(width: int, height: int, extent: int) -> tuple:
+        # The bitmap costs a quarter byte per pixel for slots x (slots + 1)
+        # tiles, the grid one byte per tile; the sum is lowest when a tile
+        # covers 2 * sqrt(width * height / (slots * (slots + 1))) pixels.
+        slots = 4 if extent else 2
+        area = 2 * math.sqrt(width * height / (slots * (slots + 1)))
+        tile_width = min(width, max(extent, 1, int(math.sqrt(area))))
+        tile_height = min(height, max(extent, 1, int(area / tile_width)))
+        tile_width = min(width, max(extent, 1, int(area / tile_height)))
+        tiles = -(-width // tile_width) * -(-height // tile_height)
+        if width * height <= 4 * tiles + slots * (slots + 1) * tile_width * tile_height:
+            return (width, height)
+        return (tile_width, tile_height)
 
     @property
     def fill(self) -> Optional[int]:
         """The fill of the rectangle. Can be a hex value for a color or ``None`` for
         transparent."""
-        return self._palette[0]
+        return self._palette[self._FILL]
 
     @fill.setter
     def fill(self, color: Optional[int]) -> None:
         if color is None:
-            self._palette[0] = 0
-            self._palette.make_transparent(0)
+            self._palette[self._FILL] = 0
+            self._palette.make_transparent(self._FILL)
         else:
-            self._palette[0] = color
-            self._palette.make_opaque(0)
+            self._palette[self._FILL] = color
+            self._palette.make_opaque(self._FILL)
 
     @property
     def outline(self) -> Optional[int]:
         """The outline of the rectangle. Can be a hex value for a color or ``None``
         for no outline."""
-        return self._palette[1]
+        return self._palette[self._OUTLINE]
 
     @outline.setter
     def outline(self, color: Optional[int]) -> None:
         if color is None:
-            self._palette[1] = 0
-            self._palette.make_transparent(1)
+            self._palette[self._OUTLINE] = 0
+            self._palette.make_transparent(self._OUTLINE)
         else:
-            self._palette[1] = color
-            self._palette.make_opaque(1)
+            self._palette[self._OUTLINE] = color
+            self._palette.make_opaque(self._OUTLINE)
 
     @property
     def width(self) -> int:
         """
-        :return: the width of the rectangle in pixels
+        :return: the width of the rectangle in pixels. Can be changed up to ``max_width``,
+            give or take a partial tile.
         """
-        return self._bitmap.width
+        return self._width
+
+    @width.setter
+    def width(self, width: int) -> None:
+        if width <= 0:
+            raise ValueError("Rectangle dimensions must be larger than 0.")
+        self._reshape("_width", width)
 
     @property
     def height(self) -> int:
         """
-        :return: the height of the rectangle in pixels
+        :return: the height of the rectangle in pixels. Can be changed up to ``max_height``,
+            give or take a partial tile.
         """
-        return self._bitmap.height
+        return self._height
+
+    @height.setter
+    def height(self, height: int) -> None:
+        if height <= 0:
+            raise ValueError("Rectangle dimensions must be larger than 0.")
+        self._reshape("_height", height)
+
+    @property
+    def stroke(self) -> int:
+        """The width of the outline in pixels. Can be changed up to ``max_stroke``."""
+        return self._stroke
+
+    @stroke.setter
+    def stroke(self, stroke: int) -> None:
+        if stroke > self._max_stroke:
+            raise ValueError("Stroke cannot exceed max_stroke.")
+        self._reshape("_stroke", stroke)
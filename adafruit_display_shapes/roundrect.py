@@ -16,13 +16,20 @@ try:
 except ImportError:
     pass
 
+import math
+from array import array
+
+import bitmaptools
 import displayio
 
+from adafruit_display_shapes.rect import Rect
+from adafruit_display_shapes.shape_cache import ShapeCache
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Shapes.git"
 
 
-class RoundRect(displayio.TileGrid):
+class RoundRect(Rect):
     """A round-corner rectangle.
 
     :param int x: The x-position of the top left corner.
@@ -36,9 +43,21 @@ class RoundRect(displayio.TileGrid):
                     for a color or ``None`` for no outline.
     :param int stroke: Used for the outline. Will not change the outer bound size set by ``width``
                     and ``height``.
+    :param int|None max_width: (Optional) The largest width the rounded-corner rectangle can
+                    be changed to later. (None for ``width``)
+    :param int|None max_height: (Optional) The largest height the rounded-corner rectangle can
+                    be changed to later. (None for ``height``)
+    :param int|None max_stroke: (Optional) The largest stroke the outline can be changed to
+                    later. (None for ``stroke``)
+    :param int|None max_r: (Optional) The largest radius the corners can be changed to
+                    later. (None for ``r``)
 
     """
 
+    _FILL = 2
+    _OUTLINE = 1
+    _CLEAR = 0
+
     def __init__(
         self,
         x: int,
@@ -50,154 +69,183 @@ class RoundRect(displayio.TileGrid):
         fill: Optional[int] = None,
         outline: Optional[int] = None,
         stroke: int = 1,
+        max_width: Optional[int] = None,
+        max_height: Optional[int] = None,
+        max_stroke: Optional[int] = None,
+        max_r: Optional[int] = None,
     ) -> None:
         if width <= 0 or height <= 0:
             raise ValueError("Rectangle dimensions must be larger than 0.")
         if r > width / 2 or r > height / 2:
             raise ValueError("Radius cannot exceed half of the smaller side (width or height).")
-
-        self._palette = displayio.Palette(3)
-        self._palette.make_transparent(0)
-        self._bitmap = displayio.Bitmap(width, height, 3)
-        for i in range(0, width):  # draw the center chunk
-            for j in range(r, height - r):  # draw the center chunk
-                self._bitmap[i, j] = 2
-        self._helper(
-            r,
-            r,
-            r,
-            color=2,
-            fill=True,
-            x_offset=width - 2 * r - 1,
-            y_offset=height - 2 * r - 1,
+        self._max_r = r if max_r is None else max_r
+        if r > self._max_r:
+            raise ValueError("Radius cannot exceed max_r.")
+
+        self._r = r
+        super().__init__(
+            x,
+            y,
+            width,
+            height,
+            fill=fill,
+            outline=outline,
+            stroke=stroke,
+            max_width=max_width,
+            max_height=max_height,
+            max_stroke=max_stroke,
         )
 
-        if fill is not None:
-            self._palette[2] = fill
-            self._palette.make_opaque(2)
-        else:
-            self._palette.make_transparent(2)
-            self._palette[2] = 0
-
-        if outline is not None:
-            self._palette[1] = outline
-            # draw flat sides
-            for w in range(r, width - r):
-                for line in range(stroke):
-                    self._bitmap[w, line] = 1
-                    self._bitmap[w, height - line - 1] = 1
-            for _h in range(r, height - r):
-                for line in range(stroke):
-                    self._bitmap[line, _h] = 1
-                    self._bitmap[width - line - 1, _h] = 1
-            # draw round corners
-            self._helper(
-                r,
-                r,
-                r,
-                color=1,
-                stroke=stroke,
-                x_offset=width - 2 * r - 1,
-                y_offset=height - 2 * r - 1,
-            )
-        super().__init__(self._bitmap, pixel_shader=self._palette, x=x, y=y)
-
-    def _helper(
-        self,
-        x0: int,
-        y0: int,
-        r: int,
-        *,
-        color: int,
-        x_offset: int = 0,
-        y_offset: int = 0,
-        stroke: int = 1,
-        corner_flags: int = 0xF,
-        fill: bool = False,
-    ) -> None:
-        f = 1 - r
-        ddF_x = 1
-        ddF_y = -2 * r
-        x = 0
-        y = r
-
-        while x < y:
-            if f >= 0:
-                y -= 1
-                ddF_y += 2
-                f += ddF_y
-            x += 1
-            ddF_x += 2
-            f += ddF_x
-            if corner_flags & 0x8:
-                if fill:
-                    for w in range(x0 - y, x0 + y + x_offset):
-                        self._bitmap[w, y0 + x + y_offset] = color
-                    for w in range(x0 - x, x0 + x + x_offset):
-                        self._bitmap[w, y0 + y + y_offset] = color
-                else:
-                    for line in range(stroke):
-                        self._bitmap[x0 - y + line, y0 + x + y_offset] = color
-                        self._bitmap[x0 - x, y0 + y + y_offset - line] = color
-            if corner_flags & 0x1:
-                if fill:
-                    for w in range(x0 - y, x0 + y + x_offset):
-                        self._bitmap[w, y0 - x] = color
-                    for w in range(x0 - x, x0 + x + x_offset):
-                        self._bitmap[w, y0 - y] = color
-                else:
-                    for line in range(stroke):
-                        self._bitmap[x0 - y + line, y0 - x] = color
-                        self._bitmap[x0 - x, y0 - y + line] = color
-            if corner_flags & 0x4:
-                for line in range(stroke):
-                    self._bitmap[x0 + x + x_offset, y0 + y + y_offset - line] = color
-                    self._bitmap[x0 + y + x_offset - line, y0 + x + y_offset] = color
-            if corner_flags & 0x2:
-                for line in range(stroke):
-                    self._bitmap[x0 + x + x_offset, y0 - y + line] = color
-                    self._bitmap[x0 + y + x_offset - line, y0 - x] = color
-
-    @property
-    def fill(self) -> Optional[int]:
-        """The fill of the rounded-corner rectangle. Can be a hex value for a color or ``None`` for
-        transparent."""
-        return self._palette[2]
-
-    @fill.setter
-    def fill(self, color: Optional[int]) -> None:
-        if color is None:
-            self._palette[2] = 0
-            self._palette.make_transparent(2)
-        else:
-            self._palette[2] = color
-            self._palette.make_opaque(2)
-
-    @property
-    def outline(self) -> Optional[int]:
-        """The outline of the rounded-corner rectangle. Can be a hex value for a color or ``None``
-        for no outline."""
-        return self._palette[1]
-
-    @outline.setter
-    def outline(self, color: Optional[int]) -> None:
-        if color is None:
-            self._palette[1] = 0
-            self._palette.make_transparent(1)
-        else:
-            self._palette[1] = color
-            self._palette.make_opaque(2)
-
-    @property
-    def width(self) -> int:
-        """
-        :return: the width of the rounded rectangle in pixels
-        """
-        return self._bitmap.width
+    def _fit(self) -> tuple:
+        if self._r > self._width / 2 or self._r > self._height / 2:
+            raise ValueError("Radius cannot exceed half of the smaller side (width or height).")
+        return super()._fit()
+
+    def _shape_key(self) -> tuple:
+        # the radius only shows in the extent while it is larger than the stroke
+        return super()._shape_key() + (self._r,)
+
+    def _extent(self) -> int:
+        return max(self._r, self._stroke) if self._outlined else self._r
+
+    def _max_extent(self) -> int:
+        return max(self._max_r, self._max_stroke) if self._outlined else self._max_r
+
+    def _draw(self, width: int, height: int) -> None:
+        _draw_round_rect(
+            self._bitmap,
+            width,
+            height,
+            self._r,
+            self._stroke if self._outlined else 0,
+            self._FILL,
+            self._OUTLINE,
+        )
 
     @property
-    def height(self) -> int:
-        """
-        :return: the height of the rounded rectangle in pixels
-        """
-        return self._bitmap.height
+    def r(self) -> int:
+        """The radius of the rounded corners. Can be changed up to ``max_r``, and no further
+        than half of the smaller side (width or height)."""
+        return self._r
+
+    @r.setter
+    def r(self, r: int) -> None:
+        if r > self._max_r:
+            raise ValueError("Radius cannot exceed max_r.")
+        self._reshape("_r", r)
+
+
+def _draw_round_rect(
+    bitmap: displayio.Bitmap,
+    width: int,
+    height: int,
+    r: int,
+    stroke: int,
+    fill: int,
+    outline: int,
+) -> None:
+    """Draw a round-corner rectangle at the top left of a bitmap, clipped to it.
+
+    :param int stroke: The outline width, 0 for no outline.
+    :param int fill: The color index of the fill.
+    :param int outline: The color index of the outline.
+    """
+    spans = _quadrant_spans(r, stroke)
+    # draw the center chunk
+    bitmaptools.fill_region(bitmap, 0, r, width, height - r, fill)
+    # draw the rows with round corners, mirrored from the top left one
+    for row in range(r):
+        outer = spans[2 * row]
+        inner = spans[2 * row + 1]
+        # The middle column of the corners, and their middle row, belong to the
+        # shape. Mirrored corners that meet on a side of 2 * r leave no room for
+        # them, so keep them in the rows there, as part of the edge.
+        limit = 0 if 2 * r == height and row == r - 1 else (width - 1) // 2
+        if outer > limit:
+            if not stroke:
+                inner = limit
+            outer = limit
+        for y in (row, height - 1 - row):
+            bitmaptools.fill_region(bitmap, inner, y, width - inner, y + 1, fill)
+            if stroke:
+                bitmaptools.fill_region(bitmap, outer, y, inner, y + 1, outline)
+                bitmaptools.fill_region(bitmap, width - inner, y, width - outer, y + 1, outline)
+
+    if stroke:
+        # draw flat sides
+        for x_1, y_1, x_2, y_2 in (
+            (r, 0, width - r, stroke),
+            (r, height - stroke, width - r, height),
+            (0, r, stroke, height - r),
+            (width - stroke, r, width, height - r),
+        ):
+            bitmaptools.fill_region(bitmap, x_1, y_1, x_2, y_2, outline)
+
+
+_SPANS = ShapeCache(16)
+
+
+def _quadrant_spans(r: int, stroke: int) -> array:
+    """Row extents of the top left corner of a round shape, shared by all shapes
+    with the same radius and stroke. Entries ``2 * row`` and ``2 * row + 1`` hold
+    the first column of the shape and the first column past its outline.
+
+    :param int r: The radius of the corner.
+    :param int stroke: The outline width, 0 for no outline.
+    """
+    key = (r, stroke)
+    spans = _SPANS.get(key)
+    if spans is not None:
+        return spans
+
+    # The outer edge is the circle the midpoint algorithm traces, and so is a
+    # single pixel outline. A thicker outline ends at the inner edge of the
+    # annulus between r and r - stroke, where dx * dx + dy * dy <= R * R + R
+    # for the inner radius R, so every row is one span whatever the stroke.
+    spans = array("H", [r] * (2 * r))
+    for row in range(r):
+        spans[2 * row + 1] = 0
+    f = 1 - r
+    ddF_x = 1
+    ddF_y = -2 * r
+    x = 0
+    y = r
+    while x < y:
+        if f >= 0:
+            y -= 1
+            ddF_y += 2
+            f += ddF_y
+        x += 1
+        ddF_x += 2
+        f += ddF_x
+        spans[2 * (r - x)] = min(spans[2 * (r - x)], r - y)
+        if y:
+            spans[2 * (r - y)] = min(spans[2 * (r - y)], r - x)
+        if stroke == 1:
+            # the octant below the diagonal steps sideways, the one above downwards
+            spans[2 * (r - x) + 1] = max(spans[2 * (r - x) + 1], min(r - y + 1, r))
+            if y:
+                spans[2 * (r - y) + 1] = max(spans[2 * (r - y) + 1], r - x + 1)
+
+    inner_r = r - stroke
+    for row in range(r):
+        d_y = r - row
+        if stroke > 1:
+            if inner_r >= 0 and d_y * d_y <= inner_r * inner_r + inner_r:
+                spans[2 * row + 1] = r - _isqrt(inner_r * inner_r + inner_r - d_y * d_y)
+            else:
+                spans[2 * row + 1] = r
+        spans[2 * row + 1] = max(spans[2 * row + 1], spans[2 * row])
+
+    _SPANS.put(key, spans)
+    return spans
+
+
+def _isqrt(value: int) -> int:
+    # largest root with root * root <= value; math.isqrt is missing on CircuitPython
+    root = int(math.sqrt(value))
+    while root * root > value:
+        root -= 1
+    while (root + 1) * (root + 1) <= value:
+        root += 1
+    return root
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`shape_cache`
+================================================================================
+
+Various common shapes for use with displayio - Tables shared between shapes!
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Any, Hashable
+except ImportError:
+    pass
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Shapes.git"
+
+
+class ShapeCache:
+    """Precomputed tables that shapes of the same kind share, such as the corner spans
+    of a radius. Only the most recently used ones are kept, so that the memory they take
+    stays bounded.
+
+    :param int size: How many tables to keep.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._tables = {}
+        # keys from the least to the most recently used
+        self._used = []
+
+    def get(self, key: Hashable) -> Any:
+        """The table stored for a key, or ``None`` if there is none.
+
+        :param key: The parameters the table was computed from.
+        """
+        table = self._tables.get(key)
+        if table is not None:
+            self._used.remove(key)
+            self._used.append(key)
+        return table
+
+    def put(self, key: Hashable, table: Any) -> None:
+        """Store a table, replacing the one for the same key and dropping the least
+        recently used one if there are too many.
+
+        :param key: The parameters the table was computed from.
+        :param table: The table.
+        """
+        if key in self._tables:
+            self._used.remove(key)
+        self._used.append(key)
+        self._tables[key] = table
+        if len(self._used) > self._size:
+            del self._tables[self._used.pop(0)]
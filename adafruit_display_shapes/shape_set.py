@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`shape_set`
+================================================================================
+
+Various common shapes for use with displayio - Base for many shapes in one bitmap!
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Iterable, List, Optional, Sequence, Tuple
+except ImportError:
+    pass
+
+from array import array
+
+import bitmaptools
+import displayio
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Shapes.git"
+
+
+class ShapeSet(displayio.TileGrid):
+    """Base class for a set of shapes drawn in order into one bitmap and palette. It
+    remembers the area each shape was drawn into, so a change only clears the area the
+    changed shapes covered before and cover now, and draws the shapes overlapping it
+    again.
+
+    Subclasses set up their shapes before calling ``__init__``, which draws them, and
+    provide two methods: ``_shape_bounds(index)`` returns the ``(x, y, width, height)``
+    of the area shape ``index`` covers, as ``Polygon._bounds`` does, and
+    ``_draw(index, clip)`` draws it with its color index, clipped to the
+    ``(x1, y1, x2, y2)`` rectangle ``clip``.
+
+    :param int count: The number of shapes.
+    :param color_indices: The color of each shape as an index into ``colors`` plus one,
+                    or 0 to hide the shape. It is not copied.
+    :param list colors: The colors of the shapes.
+    :param int x: The x-position of the top left corner.
+    :param int y: The y-position of the top left corner.
+    :param int width: Width of the bitmap.
+    :param int height: Height of the bitmap.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        color_indices: Sequence[int],
+        colors: List[int],
+        *,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+    ) -> None:
+        self._color_indices = color_indices
+        self._palette = displayio.Palette(len(colors) + 1)
+        self._palette.make_transparent(0)
+        for i, color in enumerate(colors):
+            self._palette[i + 1] = color
+        self._bitmap = displayio.Bitmap(width, height, len(colors) + 1)
+        # the part of the bitmap each shape was drawn into, empty when hidden
+        self._bounds = array("h", [0] * (4 * count))
+        self._redraw(None)
+
+        super().__init__(self._bitmap, pixel_shader=self._palette, x=x, y=y)
+
+    def _clipped_bounds(self, index: int) -> Tuple[int, int, int, int]:
+        if not self._color_indices[index]:
+            return (0, 0, 0, 0)
+        (x_offset, y_offset, width, height) = self._shape_bounds(index)
+        left = max(x_offset, 0)
+        top = max(y_offset, 0)
+        right = min(x_offset + width, self._bitmap.width)
+        bottom = min(y_offset + height, self._bitmap.height)
+        if left >= right or top >= bottom:
+            return (0, 0, 0, 0)
+        return (left, top, right, bottom)
+
+    def _redraw(self, shapes: Optional[Iterable[int]]) -> None:
+        count = len(self._bounds) // 4
+        if shapes is None:
+            self._bitmap.fill(0)
+            shapes = range(count)
+
+        # the union of the old and new bounds of the changed shapes
+        (left, top, right, bottom) = (self._bitmap.width, self._bitmap.height, 0, 0)
+        for index in shapes:
+            new = self._clipped_bounds(index)
+            for x_1, y_1, x_2, y_2 in (self._bounds[4 * index : 4 * index + 4], new):
+                if x_1 < x_2:
+                    (left, top) = (min(left, x_1), min(top, y_1))
+                    (right, bottom) = (max(right, x_2), max(bottom, y_2))
+            for i, value in enumerate(new):
+                self._bounds[4 * index + i] = value
+        if left >= right or top >= bottom:
+            return
+
+        bitmaptools.fill_region(self._bitmap, left, top, right, bottom, 0)
+        clip = (left, top, right, bottom)
+        bounds = self._bounds
+        for index in range(count):
+            if (
+                bounds[4 * index] < right
+                and bounds[4 * index + 2] > left
+                and bounds[4 * index + 1] < bottom
+                and bounds[4 * index + 3] > top
+            ):
+                self._draw(index, clip)
+
+    @property
+    def width(self) -> int:
+        """
+        :return: the width of the bitmap in pixels
+        """
+        return self._bitmap.width
+
+    @property
+    def height(self) -> int:
+        """
+        :return: the height of the bitmap in pixels
+        """
+        return self._bitmap.height
@@ -22,10 +22,13 @@ Implementation Notes
 """
 
 try:
-    from typing import Optional
+    from typing import Iterator, List, Optional, Tuple
 except ImportError:
     pass
 
+import bitmaptools
+import displayio
+
 from adafruit_display_shapes.polygon import Polygon
 
 __version__ = "0.0.0+auto.0"
@@ -45,6 +48,11 @@ class Triangle(Polygon):
                     ``None`` for transparent.
     :param int|None outline: The outline of the triangle. Can be a hex value for a color or
                     ``None`` for no outline.
+    :param tuple|None bitmap_size: (Optional) Minimum ``(width, height)`` of the bitmap. A
+                    larger bitmap lets the vertices be moved further later. (None)
+    :param bool turnable: (Optional) Make the bitmap a square that holds the triangle moved
+                    anywhere and turned to any angle, as long as none of its sides gets
+                    longer. (False)
     """
 
     def __init__(
@@ -58,105 +66,194 @@ class Triangle(Polygon):
         *,
         fill: Optional[int] = None,
         outline: Optional[int] = None,
+        bitmap_size: Optional[Tuple[int, int]] = None,
+        turnable: bool = False,
     ) -> None:
-        # Sort coordinates by Y order (y2 >= y1 >= y0)
-        if y0 > y1:
-            y0, y1 = y1, y0
-            x0, x1 = x1, x0
+        self._vertices = (x0, y0, x1, y1, x2, y2)
+        points = self._sorted(self._vertices)
+        if turnable:
+            (width, height) = self._turning_size(points, 1)
+            if bitmap_size is not None:
+                width = max(width, bitmap_size[0])
+                height = max(height, bitmap_size[1])
+            bitmap_size = (width, height)
+        # Initialize the bitmap and palette
+        super().__init__(points, outline=outline, fill=fill, bitmap_size=bitmap_size)
+        if fill is None:
+            self.fill = None
 
-        if y1 > y2:
-            y1, y2 = y2, y1
-            x1, x2 = x2, x1
+    @staticmethod
+    def _sorted(vertices: Tuple[int, ...]) -> List[Tuple[int, int]]:
+        # Sort coordinates by Y order (y2 >= y1 >= y0), keeping the order of ties
+        (x0, y0, x1, y1, x2, y2) = vertices
+        return sorted([(x0, y0), (x1, y1), (x2, y2)], key=lambda point: point[1])
 
-        if y0 > y1:
-            y0, y1 = y1, y0
-            x0, x1 = x1, x0
+    def _draw_points(self, offset: Tuple[int, int]) -> None:
+        ((x0, y0), (x1, y1), (x2, y2)) = self._points
+        (x_offset, y_offset) = offset
+        if self._filled:
+            _fill_triangle(
+                self._bitmap,
+                x0 + x_offset,
+                y0 + y_offset,
+                x1 + x_offset,
+                y1 + y_offset,
+                x2 + x_offset,
+                y2 + y_offset,
+                self._FILL,
+            )
+        if self._outlined:
+            Polygon.draw(self._bitmap, self._points, self._OUTLINE, offset=offset)
 
-        # Find the largest and smallest X values to figure out width for bitmap
-        xs = [x0, x1, x2]
-        points = [(x0, y0), (x1, y1), (x2, y2)]
+    def set_vertices(self, x0: int, y0: int, x1: int, y1: int, x2: int, y2: int) -> None:
+        """Move all three vertices at once. The triangle is redrawn into its bitmap, which
+        has to be large enough to hold the new one; only the area of the old triangle is
+        cleared. See ``bitmap_size`` and ``turnable`` for making room to move it.
 
-        # Initialize the bitmap and palette
-        super().__init__(points)
+        :param int x0: The x-position of the first vertex.
+        :param int y0: The y-position of the first vertex.
+        :param int x1: The x-position of the second vertex.
+        :param int y1: The y-position of the second vertex.
+        :param int x2: The x-position of the third vertex.
+        :param int y2: The y-position of the third vertex.
+        """
+        vertices = (x0, y0, x1, y1, x2, y2)
+        if vertices != self._vertices:
+            self.points = self._sorted(vertices)
+            self._vertices = vertices
 
-        if fill is not None:
-            self._draw_filled(x0 - min(xs), 0, x1 - min(xs), y1 - y0, x2 - min(xs), y2 - y0)
-            self.fill = fill
-        else:
-            self.fill = None
+    def _set_vertex(self, index: int, value: int) -> None:
+        vertices = list(self._vertices)
+        vertices[index] = value
+        self.set_vertices(*vertices)
 
-        if outline is not None:
-            self.outline = outline
-            for index, _ in enumerate(points):
-                point_a = points[index]
-                if index == len(points) - 1:
-                    point_b = points[0]
-                else:
-                    point_b = points[index + 1]
-                self._line(
-                    point_a[0] - min(xs),
-                    point_a[1] - y0,
-                    point_b[0] - min(xs),
-                    point_b[1] - y0,
-                    self._OUTLINE,
-                )
-
-    def _draw_filled(
-        self,
-        x0: int,
-        y0: int,
-        x1: int,
-        y1: int,
-        x2: int,
-        y2: int,
-    ) -> None:
-        if y0 == y2:  # Handle awkward all-on-same-line case as its own thing
-            a = x0
-            b = x0
-            if x1 < a:
-                a = x1
-            elif x1 > b:
-                b = x1
-
-            if x2 < a:
-                a = x2
-            elif x2 > b:
-                b = x2
-            self._line(a, y0, b, y0, self._FILL)
-            return
-
-        if y1 == y2:
-            last = y1  # Include y1 scanline
-        else:
-            last = y1 - 1  # Skip it
-
-        # Upper Triangle
-        for y in range(y0, last + 1):
-            a = round(x0 + (x1 - x0) * (y - y0) / (y1 - y0))
-            b = round(x0 + (x2 - x0) * (y - y0) / (y2 - y0))
-            if a > b:
-                a, b = b, a
-            self._line(a, y, b, y, self._FILL)
-        # Lower Triangle
-        for y in range(last + 1, y2 + 1):
-            a = round(x1 + (x2 - x1) * (y - y1) / (y2 - y1))
-            b = round(x0 + (x2 - x0) * (y - y0) / (y2 - y0))
-
-            if a > b:
-                a, b = b, a
-            self._line(a, y, b, y, self._FILL)
+    @property
+    def x0(self) -> int:
+        """The x-position of the first vertex."""
+        return self._vertices[0]
+
+    @x0.setter
+    def x0(self, value: int) -> None:
+        self._set_vertex(0, value)
+
+    @property
+    def y0(self) -> int:
+        """The y-position of the first vertex."""
+        return self._vertices[1]
+
+    @y0.setter
+    def y0(self, value: int) -> None:
+        self._set_vertex(1, value)
+
+    @property
+    def x1(self) -> int:
+        """The x-position of the second vertex."""
+        return self._vertices[2]
+
+    @x1.setter
+    def x1(self, value: int) -> None:
+        self._set_vertex(2, value)
+
+    @property
+    def y1(self) -> int:
+        """The y-position of the second vertex."""
+        return self._vertices[3]
+
+    @y1.setter
+    def y1(self, value: int) -> None:
+        self._set_vertex(3, value)
+
+    @property
+    def x2(self) -> int:
+        """The x-position of the third vertex."""
+        return self._vertices[4]
+
+    @x2.setter
+    def x2(self, value: int) -> None:
+        self._set_vertex(4, value)
 
     @property
-    def fill(self) -> Optional[int]:
-        """The fill of the triangle. Can be a hex value for a color or
-        ``None`` for transparent."""
-        return self._palette[self._FILL]
-
-    @fill.setter
-    def fill(self, color: Optional[int]) -> None:
-        if color is None:
-            self._palette[self._FILL] = 0
-            self._palette.make_transparent(self._FILL)
-        else:
-            self._palette[self._FILL] = color
-            self._palette.make_opaque(self._FILL)
+    def y2(self) -> int:
+        """The y-position of the third vertex."""
+        return self._vertices[5]
+
+    @y2.setter
+    def y2(self, value: int) -> None:
+        self._set_vertex(5, value)
+
+
+def _fill_triangle(
+    bitmap: displayio.Bitmap,
+    x0: int,
+    y0: int,
+    x1: int,
+    y1: int,
+    x2: int,
+    y2: int,
+    color: int,
+    clip: Optional[Tuple[int, int, int, int]] = None,
+) -> None:
+    """Fill a triangle with one span per scanline.
+
+    :param int color: The color index of the fill.
+    :param tuple|None clip: (Optional) Only draw into this ``(x1, y1, x2, y2)`` region of the
+                    bitmap, the end coordinates excluded. (None for the whole bitmap)
+    """
+    clip = clip or (0, 0, bitmap.width, bitmap.height)
+
+    # Sort coordinates by Y order (y2 >= y1 >= y0)
+    if y0 > y1:
+        y0, y1 = y1, y0
+        x0, x1 = x1, x0
+    if y1 > y2:
+        y1, y2 = y2, y1
+        x1, x2 = x2, x1
+    if y0 > y1:
+        y0, y1 = y1, y0
+        x0, x1 = x1, x0
+
+    if y0 == y2:  # Handle awkward all-on-same-line case as its own thing
+        _fill_span(bitmap, min(x0, x1, x2), max(x0, x1, x2), y0, color, clip)
+        return
+
+    if y1 == y2:
+        last = y1  # Include y1 scanline
+    else:
+        last = y1 - 1  # Skip it
+
+    # Walk the long edge from top to bottom and the two short ones after
+    # another, filling the span between them on each scanline
+    long_edge = _edge(x0, y0, x2, y2)
+    # Upper Triangle
+    for y, a, b in zip(range(y0, last + 1), _edge(x0, y0, x1, y1), long_edge):
+        _fill_span(bitmap, a, b, y, color, clip)
+    # Lower Triangle
+    for y, a, b in zip(range(last + 1, y2 + 1), _edge(x1, y1, x2, y2), long_edge):
+        _fill_span(bitmap, a, b, y, color, clip)
+
+
+def _fill_span(
+    bitmap: displayio.Bitmap, a: int, b: int, y: int, color: int, clip: Tuple[int, int, int, int]
+) -> None:
+    (left, top, right, bottom) = clip
+    if top <= y < bottom:
+        a, b = max(min(a, b), left), min(max(a, b) + 1, right)
+        if a < b:
+            bitmaptools.fill_region(bitmap, a, y, b, y + 1, color)
+
+
+def _edge(x_a: int, y_a: int, x_b: int, y_b: int) -> Iterator[int]:
+    # x of the edge on each scanline from y_a on, rounded half up, with
+    # integer steps only; x + err / d_y tracks the exact x plus 1/2
+    d_x = 2 * (x_b - x_a)
+    d_y = 2 * (y_b - y_a)
+    (step, rest) = divmod(d_x, d_y)
+    x = x_a
+    err = d_y // 2
+    while True:
+        yield x
+        x += step
+        err += rest
+        if err >= d_y:
+            x += 1
+            err -= d_y
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`triangle_mesh`
+================================================================================
+
+Various common shapes for use with displayio - Many triangles in one bitmap!
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import Iterable, List, Optional, Sequence, Tuple
+except ImportError:
+    pass
+
+from adafruit_display_shapes.polygon import Polygon
+from adafruit_display_shapes.shape_set import ShapeSet
+from adafruit_display_shapes.triangle import _fill_triangle
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Shapes.git"
+
+
+class TriangleMesh(ShapeSet):
+    """A mesh of filled triangles that share one bitmap and palette, for terrain profiles,
+    pie charts and tessellated icons. Triangles are drawn in order, so later ones cover
+    earlier ones where they overlap.
+
+    :param vertices: A flat sequence of interleaved x and y values of the vertices, relative
+                    to the top left of the mesh, such as an ``array("h")``. It is not copied.
+    :param triangles: A flat sequence of vertex indices, three per triangle. It is not copied.
+    :param color_indices: The color of each triangle as an index into ``colors`` plus one,
+                    or 0 to hide the triangle. It is not copied.
+    :param list colors: The colors of the triangles.
+    :param int x: The x-position of the top left corner.
+    :param int y: The y-position of the top left corner.
+    :param int|None width: (Optional) Width of the bitmap. (None to fit the vertices)
+    :param int|None height: (Optional) Height of the bitmap. (None to fit the vertices)
+    """
+
+    def __init__(
+        self,
+        vertices: Sequence[int],
+        triangles: Sequence[int],
+        color_indices: Sequence[int],
+        colors: List[int],
+        *,
+        x: int = 0,
+        y: int = 0,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+    ) -> None:
+        (x_offset, y_offset, bounds_width, bounds_height) = Polygon._bounds(vertices, 1)
+        if width is None:
+            width = x_offset + bounds_width
+        if height is None:
+            height = y_offset + bounds_height
+
+        self._vertices = vertices
+        self._triangles = triangles
+        super().__init__(
+            len(triangles) // 3,
+            color_indices,
+            colors,
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+        )
+
+    def _shape_bounds(self, index: int) -> Tuple[int, int, int, int]:
+        vertices = self._vertices
+        return Polygon._bounds(
+            [
+                (vertices[2 * vertex], vertices[2 * vertex + 1])
+                for vertex in self._triangles[3 * index : 3 * index + 3]
+            ],
+            1,
+        )
+
+    def _draw(self, index: int, clip: Tuple[int, int, int, int]) -> None:
+        (a, b, c) = self._triangles[3 * index : 3 * index + 3]
+        vertices = self._vertices
+        _fill_triangle(
+            self._bitmap,
+            vertices[2 * a],
+            vertices[2 * a + 1],
+            vertices[2 * b],
+            vertices[2 * b + 1],
+            vertices[2 * c],
+            vertices[2 * c + 1],
+            self._color_indices[index],
+            clip,
+        )
+
+    def update(self, triangles: Optional[Iterable[int]] = None) -> None:
+        """Redraw triangles after their vertices, vertex indices or color indices were
+        changed in place. Only the area the given triangles covered before and cover now
+        is cleared, and the triangles overlapping it are drawn again, clipped to it.
+
+        :param triangles: (Optional) The indices of the changed triangles. A moved vertex
+                    changes every triangle that uses it. (None to redraw all triangles)
+        """
+        self._redraw(triangles)
+
+    @property
+    def vertices(self) -> Sequence[int]:
+        """The interleaved x and y values of the vertices. Call `update` after changing
+        them."""
+        return self._vertices
+
+    @property
+    def triangles(self) -> Sequence[int]:
+        """The vertex indices of the triangles, three per triangle. Call `update` after
+        changing them."""
+        return self._triangles
+
+    @property
+    def color_indices(self) -> Sequence[int]:
+        """The color of each triangle as an index into the colors plus one, or 0 if the
+        triangle is hidden. Call `update` after changing them."""
+        return self._color_indices
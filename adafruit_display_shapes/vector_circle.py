@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`vector_circle`
+================================================================================
+
+Various common shapes for use with displayio - Circle shape filled by vectorio!
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import List, Optional, Union
+except ImportError:
+    pass
+
+import displayio
+import vectorio
+
+from adafruit_display_shapes.mirrored_circle import MirroredCircle
+from adafruit_display_shapes.vector_roundrect import VectorRoundRect
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Shapes.git"
+
+
+class VectorCircle(VectorRoundRect):
+    """A circle. Technically, a Group with a `vectorio.Circle` for the fill and a
+    `MirroredCircle` for the outline.
+
+    The fill needs no bitmap memory, only the outline is rasterized. Takes the same
+    arguments as `Circle`, but needs a port with vectorio.
+
+    :param int x0: The x-position of the center.
+    :param int y0: The y-position of the center.
+    :param int r: The radius of the circle.
+    :param int|None fill: The color to fill the circle. Can be a hex value for a color or
+                 ``None`` for transparent.
+    :param int|None outline: The outline of the circle. Can be a hex value for a color or
+                 ``None`` for no outline.
+    :param int stroke: Used for the outline. Will not change the radius.
+
+    """
+
+    def __init__(
+        self,
+        x0: int,
+        y0: int,
+        r: int,
+        *,
+        fill: Optional[int] = None,
+        outline: Optional[int] = None,
+        stroke: int = 1,
+    ) -> None:
+        super().__init__(
+            x0 - r,
+            y0 - r,
+            2 * r + 1,
+            2 * r + 1,
+            r,
+            fill=fill,
+            outline=outline,
+            stroke=stroke,
+        )
+
+    def _fill_shapes(self) -> List[Union[vectorio.Circle, vectorio.Rectangle]]:
+        if not self._r:
+            return super()._fill_shapes()
+        return [vectorio.Circle(pixel_shader=self._palette, radius=self._r, x=self._r, y=self._r)]
+
+    def _make_outline(self, color: int) -> displayio.Group:
+        return MirroredCircle(self._r, self._r, self._r, outline=color, stroke=self._stroke)
+
+    @property
+    def r(self) -> int:
+        """The radius of the circle."""
+        return self._r
+
+    @property
+    def x0(self) -> int:
+        """The x-position of the center of the circle."""
+        return self.x + self._r
+
+    @property
+    def y0(self) -> int:
+        """The y-position of the center of the circle."""
+        return self.y + self._r
+
+    @x0.setter
+    def x0(self, x0: int) -> None:
+        self.x = x0 - self._r
+
+    @y0.setter
+    def y0(self, y0: int) -> None:
+        self.y = y0 - self._r
@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`vector_roundrect`
+================================================================================
+
+Various common shapes for use with displayio - Round-corner rectangle filled by vectorio!
+
+
+* Author(s): Adafruit Industries
+
+Implementation Notes
+--------------------
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+"""
+
+try:
+    from typing import List, Optional, Union
+except ImportError:
+    pass
+
+import displayio
+import vectorio
+
+from adafruit_display_shapes.roundrect import RoundRect
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_Display_Shapes.git"
+
+
+class VectorRoundRect(displayio.Group):
+    """A round-corner rectangle. Technically, a Group of vectorio shapes for the fill
+    and a `RoundRect` for the outline.
+
+    The fill needs no bitmap memory, only the outline is rasterized. Takes the same
+    arguments as `RoundRect`, but needs a port with vectorio. A radius of half the
+    width or height is filled in the outline bitmap instead, as vectorio circles
+    cannot end between two pixels.
+
+    :param int x: The x-position of the top left corner.
+    :param int y: The y-position of the top left corner.
+    :param int width: The width of the rounded-corner rectangle.
+    :param int height: The height of the rounded-corner rectangle.
+    :param int r: The radius of the rounded corner.
+    :param int|None fill: The color to fill the rounded-corner rectangle. Can be a hex value
+                    for a color or ``None`` for transparent.
+    :param int|None outline: The outline of the rounded-corner rectangle. Can be a hex value
+                    for a color or ``None`` for no outline.
+    :param int stroke: Used for the outline. Will not change the outer bound size set by ``width``
+                    and ``height``.
+
+    """
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        r: int,
+        *,
+        fill: Optional[int] = None,
+        outline: Optional[int] = None,
+        stroke: int = 1,
+    ) -> None:
+        if width <= 0 or height <= 0:
+            raise ValueError("Rectangle dimensions must be larger than 0.")
+        if r > width / 2 or r > height / 2:
+            raise ValueError("Radius cannot exceed half of the smaller side (width or height).")
+
+        super().__init__(x=x, y=y)
+        self._width = width
+        self._height = height
+        self._r = r
+        self._stroke = stroke
+        self._palette = displayio.Palette(1)
+        # Circles are centered on a pixel, so vectorio cannot fill corners that
+        # take up half of an even side. Such shapes fill their outline bitmap.
+        self._vector = 2 * r < width and 2 * r < height
+        if self._vector:
+            for shape in self._fill_shapes():
+                self.append(shape)
+        self._outline_shape = None
+        self.fill = fill
+        self.outline = outline
+
+    def _fill_shapes(self) -> List[Union[vectorio.Circle, vectorio.Rectangle]]:
+        width = self._width
+        height = self._height
+        r = self._r
+        if not r:
+            return [vectorio.Rectangle(pixel_shader=self._palette, width=width, height=height)]
+        # a cross of two rectangles and a circle in each corner
+        shapes = [
+            vectorio.Rectangle(pixel_shader=self._palette, width=width, height=height - 2 * r, y=r),
+            vectorio.Rectangle(pixel_shader=self._palette, width=width - 2 * r, height=height, x=r),
+        ]
+        for x in (r, width - 1 - r):
+            for y in (r, height - 1 - r):
+                shapes.append(vectorio.Circle(pixel_shader=self._palette, radius=r, x=x, y=y))
+        return shapes
+
+    def _make_outline(self, color: Optional[int]) -> displayio.TileGrid:
+        return RoundRect(
+            0,
+            0,
+            self._width,
+            self._height,
+            self._r,
+            fill=None if self._vector or self._palette.is_transparent(0) else self._palette[0],
+            outline=color,
+            stroke=self._stroke,
+        )
+
+    @property
+    def fill(self) -> Optional[int]:
+        """The fill of the rounded-corner rectangle. Can be a hex value for a color or ``None``
+        for transparent."""
+        return self._palette[0]
+
+    @fill.setter
+    def fill(self, color: Optional[int]) -> None:
+        if color is None:
+            self._palette[0] = 0
+            self._palette.make_transparent(0)
+        else:
+            self._palette[0] = color
+            self._palette.make_opaque(0)
+        if not self._vector and self._outline_shape is not None:
+            self._outline_shape.fill = color
+
+    @property
+    def outline(self) -> Optional[int]:
+        """The outline of the rounded-corner rectangle. Can be a hex value for a color or
+        ``None`` for no outline."""
+        if self._outline_shape is None or not (self._vector or self._outline_shape._outlined):
+            return None
+        return self._outline_shape.outline
+
+    @outline.setter
+    def outline(self, color: Optional[int]) -> None:
+        # The outline bitmap is only allocated once an outline is shown. A bitmap
+        # that also holds the fill is drawn again when the outline comes or goes.
+        if self._outline_shape is not None and (
+            self._vector or self._outline_shape._outlined == (color is not None)
+        ):
+            self._outline_shape.outline = color
+        elif color is not None or not self._vector:
+            shape = self._make_outline(color)
+            if self._outline_shape is None:
+                self.append(shape)
+            else:
+                self[self.index(self._outline_shape)] = shape
+            self._outline_shape = shape
+
+    @property
+    def width(self) -> int:
+        """
+        :return: the width of the rounded rectangle in pixels
+        """
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """
+        :return: the height of the rounded rectangle in pixels
+        """
+        return self._height
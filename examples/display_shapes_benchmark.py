@@ -0,0 +1,40 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+Times how long it takes to construct shapes with large bitmaps. Needs no display.
+Run it with an older release of the library on the same board to compare.
+"""
+
+import gc
+import time
+
+from adafruit_display_shapes.circle import Circle
+from adafruit_display_shapes.rect import Rect
+from adafruit_display_shapes.roundrect import RoundRect
+
+RUNS = 3
+
+shapes = (
+    (
+        "RoundRect 300x200 r=10 stroke=3",
+        lambda: RoundRect(0, 0, 300, 200, 10, fill=0xFF0000, outline=0xFFFFFF, stroke=3),
+    ),
+    (
+        "Rect 300x200 stroke=5",
+        lambda: Rect(0, 0, 300, 200, fill=0xFF0000, outline=0xFFFFFF, stroke=5),
+    ),
+    (
+        "Circle r=100 stroke=3",
+        lambda: Circle(100, 100, 100, fill=0xFF0000, outline=0xFFFFFF, stroke=3),
+    ),
+)
+
+for name, make in shapes:
+    total = 0
+    for _ in range(RUNS):
+        gc.collect()
+        start = time.monotonic_ns()
+        make()
+        total += time.monotonic_ns() - start
+    print(f"{name}: {total / RUNS / 1000000:.1f} ms")
@@ -38,7 +38,7 @@ import fourwire
 import terminalio
 from adafruit_display_text import label
 
-from adafruit_display_shapes.line import Line
+from adafruit_display_shapes.line_set import LineSet
 from adafruit_display_shapes.rect import Rect
 from adafruit_display_shapes.sparkline import Sparkline
 
@@ -157,12 +157,15 @@ my_group.append(bounding_rectangle)
 
 total_ticks = 10
 
+# All tickmarks go into one LineSet, with the ends of each tick relative to it
+ticks = []
 for i in range(total_ticks + 1):
-    x_start = sparkline1.x - 5
-    x_end = sparkline1.x
-    y_both = int(round(sparkline1.y + (i * (chart_height) / (total_ticks))))
-    y_both = min(y_both, sparkline1.y + chart_height - 1)
-    my_group.append(Line(x_start, y_both, x_end, y_both, color=line_color))
+    y_both = int(round(i * (chart_height) / (total_ticks)))
+    y_both = min(y_both, chart_height - 1)
+    ticks.extend((0, y_both, 5, y_both))
+my_group.append(
+    LineSet(ticks, [1] * (total_ticks + 1), [line_color], x=sparkline1.x - 5, y=sparkline1.y)
+)
 
 
 # Set the display to show my_group that contains the sparkline and other graphics